@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+🎯 Shared Dataclass Options
+Keyword arguments for the immutable value records (ForexSignal, TradeOrder).
+"""
+
+import sys
+
+# Slotted frozen dataclasses only pickle / copy reliably from Python 3.11
+# (signals are pickled by st.cache_data); older interpreters keep a __dict__
+FROZEN_DATACLASS_OPTIONS = {'frozen': True, 'slots': True} if sys.version_info >= (3, 11) else {'frozen': True}
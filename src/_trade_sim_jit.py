@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+🎯 Optimized Trade Simulation Kernel
+Per-bar trailing-stop / partial-profit loop of
+OptimizedAdvancedBacktest.simulate_optimized_trade, compiled with Numba when
+it is installed and plain Python otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Outcome codes returned by the kernel (index into TRADE_OUTCOMES)
+OUTCOME_STOP_LOSS = 0
+OUTCOME_TARGET_HIT = 1
+OUTCOME_TIMEOUT = 2
+OUTCOME_NO_EXIT = 3
+TRADE_OUTCOMES = ('STOP_LOSS', 'TARGET_HIT', 'TIMEOUT', 'NO_EXIT')
+
+MAX_HOLD_BARS = 72        # Timeout after 72 hours (extended)
+PIP_VALUE_USD = 0.10      # $0.10 per pip for 1000 units
+PARTIAL_PROFIT = 0.3      # Take 30% profit at 60% to target
+
+# Explicit signatures compile eagerly at import (and load from the on-disk
+# cache afterwards) so the first backtest trade doesn't pay for JIT warmup.
+# Bars may be float32 or float64; prices, P&L and accumulators stay float64.
+TRADE_PATH_SIGNATURES = [
+    'Tuple((int64, float64, float64, float64, int64, float64))'
+    '(%s[:], float64, float64, float64, boolean, float64, float64)' % bar_type
+    for bar_type in ('float64', 'float32')
+]
+TRADE_PATHS_SIGNATURES = [
+    'Tuple((int64[:], float64[:], float64[:], float64[:], int64[:], float64[:]))'
+    '(%s[:, :], int64[:], float64[:], float64[:], float64[:], boolean[:], float64[:], float64[:])' % bar_type
+    for bar_type in ('float64', 'float32')
+]
+
+@njit(TRADE_PATH_SIGNATURES, cache=True)
+def simulate_trade_path(close, entry_price, target_price, stop_loss, is_buy, pip_size, units):
+    """
+    Walk hourly closes until stop, target or timeout.
+
+    Returns (outcome_code, exit_price, profit_pips, profit_usd, hold_hours,
+    partial_profits_taken).
+    """
+    lots = units / 1000
+
+    # Track trade progress
+    highest_favorable = entry_price
+    current_stop = stop_loss
+    partial_profits_taken = 0.0
+
+    for i in range(close.shape[0]):
+        current_price = float(close[i])
+
+        if is_buy:
+            if current_price > highest_favorable:
+                highest_favorable = current_price
+
+            # Enhanced trailing stop logic
+            progress = (highest_favorable - entry_price) / (target_price - entry_price)
+            if progress > 0.6 and partial_profits_taken == 0:
+                # Take partial profit and move stop to breakeven
+                partial_profits_taken = PARTIAL_PROFIT
+                current_stop = max(current_stop, entry_price)
+            elif progress > 0.4:
+                # Trailing stop at 40% progress
+                current_stop = max(current_stop, highest_favorable - (highest_favorable - entry_price) * 0.4)
+            elif progress > 0.25:
+                # Conservative trailing at 25% progress
+                current_stop = max(current_stop, highest_favorable - (highest_favorable - entry_price) * 0.6)
+
+            # Check exit conditions
+            if current_price <= current_stop:
+                profit_pips = (current_stop - entry_price) / pip_size
+                profit_usd = profit_pips * PIP_VALUE_USD * lots * (1 - partial_profits_taken)
+                if partial_profits_taken > 0:
+                    profit_usd += (highest_favorable - entry_price) / pip_size * PIP_VALUE_USD * lots * partial_profits_taken
+                return OUTCOME_STOP_LOSS, current_stop, profit_pips, profit_usd, i + 1, partial_profits_taken
+            elif current_price >= target_price:
+                profit_pips = (target_price - entry_price) / pip_size
+                return OUTCOME_TARGET_HIT, target_price, profit_pips, profit_pips * PIP_VALUE_USD * lots, i + 1, partial_profits_taken
+
+        else:  # SELL
+            if current_price < highest_favorable:
+                highest_favorable = current_price
+
+            progress = (entry_price - highest_favorable) / (entry_price - target_price)
+            if progress > 0.6 and partial_profits_taken == 0:
+                partial_profits_taken = PARTIAL_PROFIT
+                current_stop = min(current_stop, entry_price)
+            elif progress > 0.4:
+                current_stop = min(current_stop, highest_favorable + (entry_price - highest_favorable) * 0.4)
+            elif progress > 0.25:
+                current_stop = min(current_stop, highest_favorable + (entry_price - highest_favorable) * 0.6)
+
+            if current_price >= current_stop:
+                profit_pips = (entry_price - current_stop) / pip_size
+                profit_usd = profit_pips * PIP_VALUE_USD * lots * (1 - partial_profits_taken)
+                if partial_profits_taken > 0:
+                    profit_usd += (entry_price - highest_favorable) / pip_size * PIP_VALUE_USD * lots * partial_profits_taken
+                return OUTCOME_STOP_LOSS, current_stop, profit_pips, profit_usd, i + 1, partial_profits_taken
+            elif current_price <= target_price:
+                profit_pips = (entry_price - target_price) / pip_size
+                return OUTCOME_TARGET_HIT, target_price, profit_pips, profit_pips * PIP_VALUE_USD * lots, i + 1, partial_profits_taken
+
+        # Timeout
+        if i >= MAX_HOLD_BARS:
+            if is_buy:
+                profit_pips = (current_price - entry_price) / pip_size
+                partial_pips = (highest_favorable - entry_price) / pip_size
+            else:
+                profit_pips = (entry_price - current_price) / pip_size
+                partial_pips = (entry_price - highest_favorable) / pip_size
+
+            profit_usd = profit_pips * PIP_VALUE_USD * lots * (1 - partial_profits_taken)
+            if partial_profits_taken > 0:
+                profit_usd += partial_pips * PIP_VALUE_USD * lots * partial_profits_taken
+            return OUTCOME_TIMEOUT, current_price, profit_pips, profit_usd, MAX_HOLD_BARS, partial_profits_taken
+
+    return OUTCOME_NO_EXIT, entry_price, 0.0, 0.0, 0, partial_profits_taken
+
+@njit(TRADE_PATHS_SIGNATURES, parallel=True, cache=True)
+def simulate_trade_paths(closes, lengths, entry_prices, target_prices, stop_losses, is_buy, pip_sizes, units):
+    """
+    simulate_trade_path over a batch of independent trades, one per row.
+
+    closes is a (n_trades, max_bars) array padded past each row's length.
+    Rows are spread across cores with prange when Numba is available.
+    """
+    n = closes.shape[0]
+    outcomes = np.empty(n, dtype=np.int64)
+    exit_prices = np.empty(n, dtype=np.float64)
+    profit_pips = np.empty(n, dtype=np.float64)
+    profit_usd = np.empty(n, dtype=np.float64)
+    hold_hours = np.empty(n, dtype=np.int64)
+    partials = np.empty(n, dtype=np.float64)
+
+    for k in prange(n):
+        outcome, exit_price, pips, usd, hold, partial = simulate_trade_path(
+            closes[k, :lengths[k]], entry_prices[k], target_prices[k], stop_losses[k],
+            is_buy[k], pip_sizes[k], units[k])
+        outcomes[k] = outcome
+        exit_prices[k] = exit_price
+        profit_pips[k] = pips
+        profit_usd[k] = usd
+        hold_hours[k] = hold
+        partials[k] = partial
+
+    return outcomes, exit_prices, profit_pips, profit_usd, hold_hours, partials
@@ -146,8 +146,8 @@ class BackgroundTrader:
             logger.error(f"Error calculating position size: {e}")
             return 1000  # Default fallback
     
-    def execute_signal(self, signal) -> bool:
-        """Execute a trading signal."""
+    def execute_signal(self, signal, prices=None) -> bool:
+        """Execute a trading signal (prices: optional per-scan mid price snapshot)."""
         try:
             # Get account info
             account_summary = self.trader.get_account_summary()
@@ -161,7 +161,7 @@ class BackgroundTrader:
             position_size = self.calculate_position_size(signal, account_balance)
             
             # Execute the trade
-            order_id = self.trader.execute_signal(signal, position_size)
+            order_id = self.trader.execute_signal(signal, position_size, prices=prices)
             
             if order_id:
                 self.daily_trades += 1
@@ -226,6 +226,10 @@ Daily Trades: {self.daily_trades}/{self.max_daily_trades}
             
             logger.info(f"🎯 {len(high_confidence_signals)} signals above confidence threshold")
             
+            # One /pricing snapshot for every candidate pair, shared by all of this
+            # scan's margin checks instead of a price read per check
+            prices = self.trader.get_prices(list({s.pair.replace('/', '_') for s in high_confidence_signals}))
+            
             # Execute signals in order of confidence
             executed_count = 0
             for signal in high_confidence_signals:
@@ -235,7 +239,7 @@ Daily Trades: {self.daily_trades}/{self.max_daily_trades}
                 
                 logger.info(f"🎯 Attempting to execute: {signal.pair} {signal.signal_type} ({signal.confidence:.1%})")
                 
-                if self.execute_signal(signal):
+                if self.execute_signal(signal, prices):
                     executed_count += 1
                     # Wait a bit between executions
                     time.sleep(2)
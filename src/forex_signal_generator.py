@@ -15,13 +15,21 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 import logging
 
+if __package__:
+    from ._dataclass_options import FROZEN_DATACLASS_OPTIONS
+else:
+    from _dataclass_options import FROZEN_DATACLASS_OPTIONS
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Add import for the new Finnhub analyzer
 try:
-    from finnhub_sentiment_upgrade import get_professional_sentiment_free
+    if __package__:
+        from .finnhub_sentiment_upgrade import get_professional_sentiment_free
+    else:
+        from finnhub_sentiment_upgrade import get_professional_sentiment_free
     FINNHUB_AVAILABLE = True
     print("🚀 Finnhub Professional Sentiment Analysis ENABLED (FREE)")
 except ImportError:
@@ -30,14 +38,17 @@ except ImportError:
 
 # Add advanced technical analysis
 try:
-    from simple_technical_analyzer import SimpleTechnicalAnalyzer
+    if __package__:
+        from .simple_technical_analyzer import SimpleTechnicalAnalyzer
+    else:
+        from simple_technical_analyzer import SimpleTechnicalAnalyzer
     ADVANCED_TECHNICAL_AVAILABLE = True
     print("🔧 Advanced Multi-Timeframe Technical Analysis ENABLED")
 except ImportError:
     ADVANCED_TECHNICAL_AVAILABLE = False
     print("⚠️ Using basic technical analysis")
 
-@dataclass
+@dataclass(**FROZEN_DATACLASS_OPTIONS)
 class ForexSignal:
     """Enhanced forex signal with all necessary trading information."""
     pair: str
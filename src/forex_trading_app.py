@@ -1308,7 +1308,7 @@ def render_account_status():
     
     # Auto-refresh every 10 seconds
     if st.button("🔄 Refresh Account", key="refresh_account"):
-        st.cache_data.clear()  # Clear cache to force refresh
+        get_account_data.clear()  # Only the account cache - signals stay cached
         st.rerun()
     
     # Add auto-refresh info
@@ -8,11 +8,19 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
-from typing import List, Dict, Optional
+import os
+import zlib
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import requests
 from dataclasses import dataclass
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# Optional C-accelerated moving windows
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
 
 # Import your trading components
 from forex_signal_generator import ForexSignalGenerator
@@ -22,6 +30,27 @@ from simple_technical_analyzer import SimpleTechnicalAnalyzer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def rolling_mean(series: pd.Series, window: int) -> pd.Series:
+    """Trailing moving average, using bottleneck when it is installed."""
+    if BOTTLENECK_AVAILABLE:
+        return pd.Series(bn.move_mean(series.to_numpy(dtype=float), window), index=series.index)
+    return series.rolling(window=window).mean()
+
+# One signal generator per process, shared by every backtester in that process
+_GENERATOR = None
+
+def _init_worker():
+    """ProcessPoolExecutor initializer: build the worker's signal generator up front."""
+    global _GENERATOR
+    _GENERATOR = ForexSignalGenerator()
+
+def get_signal_generator() -> ForexSignalGenerator:
+    """Return this process's signal generator, creating it on first use."""
+    global _GENERATOR
+    if _GENERATOR is None:
+        _GENERATOR = ForexSignalGenerator()
+    return _GENERATOR
+
 @dataclass
 class BacktestTrade:
     """Represents a completed backtest trade."""
@@ -46,19 +75,34 @@ class HistoricalBacktester:
     Tests your exact trading bot logic
     """
     
-    def __init__(self):
+    def __init__(self, random_seed: Optional[int] = None):
         """Initialize the backtester."""
-        self.signal_generator = ForexSignalGenerator()
+        self.signal_generator = get_signal_generator()
         self.technical_analyzer = SimpleTechnicalAnalyzer()
         
         # OANDA credentials
-        self.api_key = "fe92315bee29b117825fed529cf3fa99-173e927b8cdbb1fc244993e24e33fd93"
-        self.account_id = "101-004-31788297-001"
+        self.api_key = os.getenv('OANDA_API_KEY')
+        self.account_id = os.getenv('OANDA_ACCOUNT_ID')
+        
+        if not self.api_key or not self.account_id:
+            raise ValueError("OANDA_API_KEY and OANDA_ACCOUNT_ID environment variables required")
+        
+        # Request headers never change - build them once and reuse the connection
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._session = requests.Session()
         
         # Backtesting parameters - MATCH YOUR BOT EXACTLY
         self.min_confidence = 0.45  # Same as background trader
         self.max_hold_hours = 168   # 1 week maximum hold time
+        self.max_hold_bars = int(np.ceil(self.max_hold_hours))  # H1 candles - timeout always fires within this many bars
         self.pairs_to_test = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD', 'NZD/USD']
+        self.random_seed = random_seed  # Set for reproducible simulated sentiment
+
+        # Simulated sentiment, pre-sampled once per pair: {pair: np.ndarray}
+        self._sentiments = {}
         
         # Results storage
         self.completed_trades = []
@@ -67,17 +111,24 @@ class HistoricalBacktester:
         logger.info("🎯 Historical Backtester initialized")
         logger.info(f"📊 Testing pairs: {', '.join(self.pairs_to_test)}")
         logger.info(f"📊 Min confidence: {self.min_confidence:.1%}")
+
+    def __getstate__(self):
+        """Ship only plain settings to worker processes."""
+        state = self.__dict__.copy()
+        state['signal_generator'] = None
+        state['completed_trades'] = []
+        return state
+
+    def __setstate__(self, state):
+        """Reattach the worker process's shared signal generator."""
+        self.__dict__.update(state)
+        self.signal_generator = get_signal_generator()
     
     def get_historical_data(self, pair: str, start_date: datetime, end_date: datetime, granularity: str = 'H1') -> Optional[pd.DataFrame]:
         """Get historical OANDA data for backtesting."""
         try:
             oanda_pair = pair.replace('/', '_')
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             # Format dates for OANDA API
             start_str = start_date.strftime('%Y-%m-%dT%H:%M:%S.000000000Z')
             end_str = end_date.strftime('%Y-%m-%dT%H:%M:%S.000000000Z')
@@ -90,7 +141,7 @@ class HistoricalBacktester:
                 "price": "M"  # Mid prices
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self._session.get(url, headers=self._headers, params=params, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -117,7 +168,12 @@ class HistoricalBacktester:
                 if not df_data:
                     return None
                 
-                df = pd.DataFrame(df_data)
+                # float32 is ample for H1 FX quotes and halves the scan working set;
+                # P&L maths casts back to Python floats
+                df = pd.DataFrame(df_data).astype({
+                    'open': 'float32', 'high': 'float32', 'low': 'float32',
+                    'close': 'float32', 'volume': 'float32'
+                })
                 df.set_index('timestamp', inplace=True)
                 df.sort_index(inplace=True)
                 
@@ -132,23 +188,24 @@ class HistoricalBacktester:
             logger.error(f"Error getting historical data for {pair}: {e}")
             return None
     
-    def simulate_signal_generation(self, pair: str, timestamp: datetime, historical_data: pd.DataFrame) -> Optional[Dict]:
+    def simulate_signal_generation(self, pair: str, timestamp: datetime, historical_data: pd.DataFrame, end_idx: int, scan_index: int) -> Optional[Dict]:
         """
         Simulate signal generation at a specific point in time
-        Uses only data available up to that timestamp
+        Uses only data available up to that timestamp (bar end_idx)
         """
         try:
             # Get data up to the current timestamp
-            available_data = historical_data[historical_data.index <= timestamp]
+            available_data = historical_data.iloc[:end_idx + 1]
             
             if len(available_data) < 50:  # Need enough data for analysis
                 return None
             
-            current_price = available_data['close'].iloc[-1]
+            current_price = float(available_data['close'].iloc[-1])
             
             # Simulate news sentiment (simplified for backtesting)
             # In real backtesting, you'd use historical news data
-            sentiment = np.random.uniform(-0.3, 0.3)  # Neutral bias for backtesting
+            # (neutral-biased draws, sampled per pair up front)
+            sentiment = self._sentiments[pair][scan_index]
             
             # Get technical analysis using available data
             technical_analysis = self.simulate_technical_analysis(pair, available_data)
@@ -165,7 +222,8 @@ class HistoricalBacktester:
                 return {
                     'signal': signal,
                     'timestamp': timestamp,
-                    'current_price': current_price
+                    'current_price': current_price,
+                    'entry_idx': end_idx
                 }
             
             return None
@@ -183,8 +241,8 @@ class HistoricalBacktester:
             # Use the same technical analysis as your live bot
             # Calculate RSI
             delta = data['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+            gain = rolling_mean(delta.where(delta > 0, 0), 14)
+            loss = rolling_mean(-delta.where(delta < 0, 0), 14)
             rs = gain / loss
             rsi = 100 - (100 / (1 + rs))
             current_rsi = rsi.iloc[-1]
@@ -201,7 +259,7 @@ class HistoricalBacktester:
             high_close = np.abs(data['high'] - data['close'].shift())
             low_close = np.abs(data['low'] - data['close'].shift())
             true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            atr = true_range.rolling(window=14).mean().iloc[-1]
+            atr = rolling_mean(true_range, 14).iloc[-1]
             
             # Generate technical score (simplified)
             rsi_score = 0.0
@@ -237,17 +295,18 @@ class HistoricalBacktester:
         try:
             signal = signal_data['signal']
             entry_time = signal_data['timestamp']
-            entry_price = signal_data['current_price']
+            entry_price = float(signal_data['current_price'])
             
-            # Get future data for trade simulation
-            future_data = historical_data[historical_data.index > entry_time]
+            # Get future data for trade simulation, bounded by the maximum hold time
+            entry_idx = signal_data['entry_idx']
+            future_data = historical_data.iloc[entry_idx + 1:entry_idx + 1 + self.max_hold_bars]
             
             if len(future_data) == 0:
                 return None
             
             # Track the trade
             for i, (timestamp, row) in enumerate(future_data.iterrows()):
-                current_price = row['close']
+                current_price = float(row['close'])
                 hours_elapsed = (timestamp - entry_time).total_seconds() / 3600
                 
                 # Check for target hit
@@ -363,7 +422,70 @@ class HistoricalBacktester:
             logger.error(f"Error simulating trade execution: {e}")
             return None
     
-    def run_backtest(self, start_date: datetime, end_date: datetime, scan_interval_hours: int = 4) -> Dict:
+    def get_scan_positions(self, historical_data: pd.DataFrame, start_date: datetime, end_date: datetime, scan_interval_hours: int) -> np.ndarray:
+        """
+        Map each scan time onto the latest candle at or before it
+        Returns unique integer positions into historical_data
+        """
+        scan_times = pd.date_range(start_date, end_date, freq=f'{scan_interval_hours}h', inclusive='left')
+
+        # OANDA candle timestamps are UTC-aware; scan times are built from naive datetimes
+        if historical_data.index.tz is not None and scan_times.tz is None:
+            scan_times = scan_times.tz_localize(historical_data.index.tz)
+
+        positions = historical_data.index.get_indexer(scan_times, method='pad')
+
+        # Drop scan times before the first candle and collapse repeats across market gaps
+        return np.unique(positions[positions >= 0])
+
+    def get_sentiment_rng(self, pair: str) -> np.random.Generator:
+        """Per-pair random generator, stable across runs and worker processes when seeded."""
+        if self.random_seed is None:
+            return np.random.default_rng()
+        return np.random.default_rng([self.random_seed, zlib.crc32(pair.encode())])
+
+    def backtest_pair(self, pair: str, start_date: datetime, end_date: datetime, scan_interval_hours: int) -> Tuple[int, List[BacktestTrade]]:
+        """
+        Backtest a single currency pair
+        Returns the number of signals generated and the completed trades
+        """
+        signals_generated = 0
+        trades = []
+
+        logger.info(f"📈 Testing {pair}...")
+        
+        # Get historical data for this pair
+        historical_data = self.get_historical_data(pair, start_date, end_date, 'H1')
+        
+        if historical_data is None:
+            logger.warning(f"⚠️ No data available for {pair}")
+            return 0, []
+        
+        # Align every scan time to its candle in one vectorized lookup
+        scan_positions = self.get_scan_positions(historical_data, start_date, end_date, scan_interval_hours)
+
+        # Sample this pair's simulated sentiment for every scan in one draw
+        self._sentiments[pair] = self.get_sentiment_rng(pair).uniform(-0.3, 0.3, size=len(scan_positions))
+
+        # Simulate signal generation at regular intervals
+        for scan_index, position in enumerate(scan_positions):
+            current_time = historical_data.index[position]
+            signal_data = self.simulate_signal_generation(pair, current_time, historical_data, end_idx=position, scan_index=scan_index)
+
+            if signal_data:
+                signals_generated += 1
+                logger.info(f"📊 Generated signal: {pair} {signal_data['signal'].signal_type} at {current_time} (confidence: {signal_data['signal'].confidence:.1%})")
+
+                # Simulate trade execution
+                trade = self.simulate_trade_execution(signal_data, historical_data)
+
+                if trade:
+                    trades.append(trade)
+                    logger.info(f"✅ Trade completed: {trade.outcome} - {trade.pips_gained:.1f} pips in {trade.hold_time_hours:.1f} hours")
+
+        return signals_generated, trades
+
+    def run_backtest(self, start_date: datetime, end_date: datetime, scan_interval_hours: int = 4, max_workers: int = 1) -> Dict:
         """
         Run comprehensive backtest over specified period
         """
@@ -373,37 +495,24 @@ class HistoricalBacktester:
         total_signals_generated = 0
         total_trades_executed = 0
         
-        for pair in self.pairs_to_test:
-            logger.info(f"📈 Testing {pair}...")
-            
-            # Get historical data for this pair
-            historical_data = self.get_historical_data(pair, start_date, end_date, 'H1')
-            
-            if historical_data is None:
-                logger.warning(f"⚠️ No data available for {pair}")
-                continue
-            
-            # Simulate signal generation at regular intervals
-            current_time = start_date
-            while current_time < end_date:
-                # Check if we have data for this timestamp
-                if current_time in historical_data.index:
-                    signal_data = self.simulate_signal_generation(pair, current_time, historical_data)
-                    
-                    if signal_data:
-                        total_signals_generated += 1
-                        logger.info(f"📊 Generated signal: {pair} {signal_data['signal'].signal_type} at {current_time} (confidence: {signal_data['signal'].confidence:.1%})")
-                        
-                        # Simulate trade execution
-                        trade = self.simulate_trade_execution(signal_data, historical_data)
-                        
-                        if trade:
-                            total_trades_executed += 1
-                            self.completed_trades.append(trade)
-                            logger.info(f"✅ Trade completed: {trade.outcome} - {trade.pips_gained:.1f} pips in {trade.hold_time_hours:.1f} hours")
-                
-                # Move to next scan time
-                current_time += timedelta(hours=scan_interval_hours)
+        if max_workers > 1:
+            # Pairs are independent - fan them out, one signal generator per worker process
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+                futures = [
+                    executor.submit(self.backtest_pair, pair, start_date, end_date, scan_interval_hours)
+                    for pair in self.pairs_to_test
+                ]
+                pair_results = [future.result() for future in futures]
+        else:
+            pair_results = [
+                self.backtest_pair(pair, start_date, end_date, scan_interval_hours)
+                for pair in self.pairs_to_test
+            ]
+
+        for signals_generated, trades in pair_results:
+            total_signals_generated += signals_generated
+            total_trades_executed += len(trades)
+            self.completed_trades.extend(trades)
         
         # Calculate results
         results = self.calculate_results()
@@ -437,17 +546,23 @@ class HistoricalBacktester:
         
         # Calculate key metrics
         total_trades = len(df)
-        winning_trades = len(df[df['outcome'] == 'WIN'])
-        losing_trades = len(df[df['outcome'] == 'LOSS'])
-        timeout_trades = len(df[df['outcome'] == 'TIMEOUT'])
-        
+
+        # Single grouped pass over outcomes instead of one boolean mask per metric
+        by_outcome = df.groupby('outcome')['profit_loss'].agg(['count', 'sum', 'mean'])
+        outcome_counts = by_outcome['count']
+        winning_trades = int(outcome_counts.get('WIN', 0))
+        losing_trades = int(outcome_counts.get('LOSS', 0))
+        timeout_trades = int(outcome_counts.get('TIMEOUT', 0))
+
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
-        
+
         total_profit = df['profit_loss'].sum()
-        avg_win = df[df['outcome'] == 'WIN']['profit_loss'].mean() if winning_trades > 0 else 0
-        avg_loss = df[df['outcome'] == 'LOSS']['profit_loss'].mean() if losing_trades > 0 else 0
-        
-        profit_factor = abs(df[df['profit_loss'] > 0]['profit_loss'].sum() / df[df['profit_loss'] < 0]['profit_loss'].sum()) if df[df['profit_loss'] < 0]['profit_loss'].sum() != 0 else float('inf')
+        avg_win = by_outcome.loc['WIN', 'mean'] if winning_trades > 0 else 0
+        avg_loss = by_outcome.loc['LOSS', 'mean'] if losing_trades > 0 else 0
+
+        gross_profit = df['profit_loss'].clip(lower=0).sum()
+        gross_loss = df['profit_loss'].clip(upper=0).sum()
+        profit_factor = abs(gross_profit / gross_loss) if gross_loss != 0 else float('inf')
         
         avg_hold_time = df['hold_time_hours'].mean()
         
@@ -487,7 +602,7 @@ class HistoricalBacktester:
             logger.error(f"Cannot generate report: {results['error']}")
             return
         
-        html_content = f"""
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -549,14 +664,15 @@ class HistoricalBacktester:
                     <h2>💱 Performance by Currency Pair</h2>
                     <table>
                         <tr><th>Pair</th><th>Win Rate</th><th>Total Profit</th><th>Total Pips</th></tr>
-        """
+        """]
         
-        for pair, data in results['pair_results']['outcome'].items():
-            profit = results['pair_results']['profit_loss'][pair]
-            pips = results['pair_results']['pips_gained'][pair]
-            html_content += f"<tr><td>{pair}</td><td>{data:.1%}</td><td>${profit:.2f}</td><td>{pips:.1f}</td></tr>"
+        pair_results = results['pair_results']
+        parts.append(''.join(
+            f"<tr><td>{pair}</td><td>{data:.1%}</td><td>${pair_results['profit_loss'][pair]:.2f}</td><td>{pair_results['pips_gained'][pair]:.1f}</td></tr>"
+            for pair, data in pair_results['outcome'].items()
+        ))
         
-        html_content += """
+        parts.append("""
                     </table>
                 </div>
                 
@@ -564,44 +680,46 @@ class HistoricalBacktester:
                     <h2>🎯 Performance by Confidence Level</h2>
                     <table>
                         <tr><th>Confidence Range</th><th>Win Rate</th><th>Total Profit</th></tr>
-        """
+        """)
         
-        for conf_range, data in results['confidence_results']['outcome'].items():
-            profit = results['confidence_results']['profit_loss'][conf_range]
-            html_content += f"<tr><td>{conf_range}</td><td>{data:.1%}</td><td>${profit:.2f}</td></tr>"
+        confidence_results = results['confidence_results']
+        parts.append(''.join(
+            f"<tr><td>{conf_range}</td><td>{data:.1%}</td><td>${confidence_results['profit_loss'][conf_range]:.2f}</td></tr>"
+            for conf_range, data in confidence_results['outcome'].items()
+        ))
         
-        html_content += """
+        parts.append("""
                     </table>
                 </div>
                 
                 <div class="section">
                     <h2>💡 Key Insights</h2>
-        """
+        """)
         
         # Add insights based on results
         if results['win_rate'] > 0.6:
-            html_content += "<p>✅ <strong>Excellent win rate!</strong> Your bot shows strong predictive capability.</p>"
+            parts.append("<p>✅ <strong>Excellent win rate!</strong> Your bot shows strong predictive capability.</p>")
         elif results['win_rate'] > 0.5:
-            html_content += "<p>✅ <strong>Good win rate.</strong> Your bot is profitable with room for optimization.</p>"
+            parts.append("<p>✅ <strong>Good win rate.</strong> Your bot is profitable with room for optimization.</p>")
         else:
-            html_content += "<p>⚠️ <strong>Win rate needs improvement.</strong> Consider adjusting confidence thresholds.</p>"
+            parts.append("<p>⚠️ <strong>Win rate needs improvement.</strong> Consider adjusting confidence thresholds.</p>")
         
         if results['profit_factor'] > 1.5:
-            html_content += "<p>✅ <strong>Strong profit factor!</strong> Your wins significantly outweigh losses.</p>"
+            parts.append("<p>✅ <strong>Strong profit factor!</strong> Your wins significantly outweigh losses.</p>")
         elif results['profit_factor'] > 1.0:
-            html_content += "<p>✅ <strong>Profitable system.</strong> Positive expectancy confirmed.</p>"
+            parts.append("<p>✅ <strong>Profitable system.</strong> Positive expectancy confirmed.</p>")
         else:
-            html_content += "<p>⚠️ <strong>Profit factor below 1.0.</strong> System needs optimization.</p>"
+            parts.append("<p>⚠️ <strong>Profit factor below 1.0.</strong> System needs optimization.</p>")
         
-        html_content += """
+        parts.append("""
                 </div>
             </div>
         </body>
         </html>
-        """
+        """)
         
         with open(save_path, 'w') as f:
-            f.write(html_content)
+            f.write(''.join(parts))
         
         logger.info(f"📊 Report saved to {save_path}")
 
@@ -5,12 +5,19 @@ Professional forex trading interface with modern design
 """
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from jinja2 import Template
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
 import time
 import logging
+import json
+import os
+import re
+import string
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +27,6 @@ logger = logging.getLogger(__name__)
 try:
     from forex_signal_generator import ForexSignalGenerator
     from oanda_trader import OANDATrader
-    from simple_backtest import SimpleBacktester
     MODULES_AVAILABLE = True
 except ImportError as e:
     MODULES_AVAILABLE = False
@@ -35,7 +41,7 @@ st.set_page_config(
 )
 
 # Beautiful CSS styling for mobile-first design
-st.markdown("""
+APP_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700;800;900&display=swap');
     
@@ -511,7 +517,17 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def get_app_css():
+    """Minify the app stylesheet once per process - it is re-sent on every rerun"""
+    css = re.sub(r"/\*.*?\*/", "", APP_CSS, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", css).strip()
+
+def inject_css():
+    """Inject the cached stylesheet"""
+    st.markdown(get_app_css(), unsafe_allow_html=True)
 
 def render_header():
     """Render the beautiful header for James's Trading Bot"""
@@ -523,168 +539,254 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
 
+# Status chips never change wording - build them once as (label, online, html)
+STATUS_CHIP_TEMPLATE = '<div class="status-{state}"><span class="status-dot"></span>{label}</div>'
+
+def _status_chip(label, online):
+    return label, online, STATUS_CHIP_TEMPLATE.format(state="online" if online else "offline", label=label)
+
+STATUS_SYSTEM_ONLINE = _status_chip("System Online", True)
+STATUS_SYSTEM_OFFLINE = _status_chip("System Offline", False)
+STATUS_MARKET_OPEN = _status_chip("Market Open", True)
+STATUS_MARKET_CLOSED = _status_chip("Market Closed", False)
+STATUS_OANDA_CONNECTED = _status_chip("OANDA Connected", True)
+STATUS_SIGNALS_ACTIVE = _status_chip("Signals Active", True)
+
+# st.badge arrived in Streamlit 1.46
+NATIVE_BADGES = hasattr(st, "badge")
+
+@st.cache_data(ttl=60)
+def get_status_snapshot():
+    """System/market status, refreshed at most once a minute"""
+    current_time = datetime.now()
+    market_open = 9 <= current_time.hour <= 17  # Market hours approximation
+    return MODULES_AVAILABLE, market_open
+
+def render_status_chip(chip):
+    """Native badge on Streamlit 1.46+, prebuilt HTML chip otherwise"""
+    label, online, chip_html = chip
+    if NATIVE_BADGES:
+        st.badge(label, color="green" if online else "red")
+    else:
+        st.markdown(chip_html, unsafe_allow_html=True)
+
 def render_status_bar():
     """Render the status bar with market and system status"""
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if MODULES_AVAILABLE:
-            st.markdown('<div class="status-online"><span class="status-dot"></span>System Online</div>', unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="status-offline"><span class="status-dot"></span>System Offline</div>', unsafe_allow_html=True)
+    system_online, market_open = get_status_snapshot()
+    chips = (
+        STATUS_SYSTEM_ONLINE if system_online else STATUS_SYSTEM_OFFLINE,
+        STATUS_MARKET_OPEN if market_open else STATUS_MARKET_CLOSED,  # Market status (simplified)
+        STATUS_OANDA_CONNECTED,
+        STATUS_SIGNALS_ACTIVE
+    )
     
-    with col2:
-        # Market status (simplified)
-        current_time = datetime.now()
-        if 9 <= current_time.hour <= 17:  # Market hours approximation
-            st.markdown('<div class="status-online"><span class="status-dot"></span>Market Open</div>', unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="status-offline"><span class="status-dot"></span>Market Closed</div>', unsafe_allow_html=True)
+    for col, chip in zip(st.columns(4), chips):
+        with col:
+            render_status_chip(chip)
+
+@st.cache_resource
+def get_signal_generator():
+    """One signal generator shared across reruns and sessions"""
+    return ForexSignalGenerator()
+
+@st.cache_resource
+def get_trader():
+    """One OANDA trader shared across reruns and sessions (None without credentials)"""
+    api_key = os.getenv('OANDA_API_KEY')
+    account_id = os.getenv('OANDA_ACCOUNT_ID')
     
-    with col3:
-        st.markdown('<div class="status-online"><span class="status-dot"></span>OANDA Connected</div>', unsafe_allow_html=True)
+    if not api_key or not account_id:
+        return None
     
-    with col4:
-        st.markdown('<div class="status-online"><span class="status-dot"></span>Signals Active</div>', unsafe_allow_html=True)
+    return OANDATrader(api_key, account_id)
 
-@st.cache_data(ttl=30)  # Cache for 30 seconds
+LIVE_SIGNALS_TTL_SECONDS = 30
+
+@st.cache_data(ttl=LIVE_SIGNALS_TTL_SECONDS)
 def get_live_signals(min_confidence=0.25):
     """Get live trading signals"""
     if not MODULES_AVAILABLE:
         return []
     
     try:
-        generator = ForexSignalGenerator()
+        generator = get_signal_generator()
         signals = generator.generate_forex_signals(max_signals=5, min_confidence=min_confidence)
         return signals
     except Exception as e:
         logger.error(f"Error generating signals: {e}")
         return []
 
-def render_signal_card(signal, index):
-    """Render a beautiful signal card"""
-    signal_type = signal.signal_type.upper()
-    card_class = "signal-card-buy" if signal_type == "BUY" else "signal-card-sell"
-    type_class = "signal-type-buy" if signal_type == "BUY" else "signal-type-sell"
-    
-    # Calculate potential profit
-    if signal_type == "BUY":
-        potential_profit = signal.target_price - signal.entry_price
-    else:
-        potential_profit = signal.entry_price - signal.target_price
-    
-    potential_profit_pct = (potential_profit / signal.entry_price) * 100
-    
-    st.markdown(f"""
+# Static card fragments, assembled once at import into SIGNAL_CARD_TEMPLATE
+PRICE_ITEM_TEMPLATE = string.Template("""
+            <div class="price-item">
+                <div class="price-label">$label</div>
+                <div class="price-value">$value</div>$pips
+            </div>""")
+PRICE_PIPS_TEMPLATE = string.Template("""
+                <div class="price-pips">$pips</div>""")
+
+PRICE_GRID_HTML = '<div class="price-grid">' + "".join(
+    PRICE_ITEM_TEMPLATE.substitute(label=label, value=value, pips=PRICE_PIPS_TEMPLATE.substitute(pips=pips) if pips else "")
+    for label, value, pips in (
+        ("Entry Price", "{entry_price:.5f}", None),
+        ("Target", "{target_price:.5f}", "+{pips_target} pips"),
+        ("Stop Loss", "{stop_loss:.5f}", "-{pips_risk} pips"),
+        ("Risk/Reward", "{risk_reward_ratio}", "{potential_profit_pct:.1f}% potential"),
+    )
+) + """
+        </div>"""
+
+ACTION_BUTTONS_HTML = """<div class="action-buttons">
+            <button class="btn-execute" onclick="alert('Execute trade for {pair}')">
+                🚀 Execute Trade
+            </button>
+            <button class="btn-details" onclick="alert('Show details for {pair}')">
+                📊 View Details
+            </button>
+        </div>"""
+
+# Signal card markup - filled in per signal by signal_card_html
+SIGNAL_CARD_TEMPLATE = """
     <div class="{card_class}">
         <div class="signal-header">
-            <h2 class="signal-pair">{signal.pair}</h2>
+            <h2 class="signal-pair">{pair}</h2>
             <div>
                 <button class="{type_class}">{signal_type}</button>
                 <div style="margin-top: 0.5rem;">
-                    <span class="confidence-badge">{signal.confidence:.1%} Confidence</span>
+                    <span class="confidence-badge">{confidence_pct:.1f}% Confidence</span>
                 </div>
             </div>
         </div>
         
-        <div class="price-grid">
-            <div class="price-item">
-                <div class="price-label">Entry Price</div>
-                <div class="price-value">{signal.entry_price:.5f}</div>
-            </div>
-            <div class="price-item">
-                <div class="price-label">Target</div>
-                <div class="price-value">{signal.target_price:.5f}</div>
-                <div class="price-pips">+{signal.pips_target} pips</div>
-            </div>
-            <div class="price-item">
-                <div class="price-label">Stop Loss</div>
-                <div class="price-value">{signal.stop_loss:.5f}</div>
-                <div class="price-pips">-{signal.pips_risk} pips</div>
-            </div>
-            <div class="price-item">
-                <div class="price-label">Risk/Reward</div>
-                <div class="price-value">{signal.risk_reward_ratio}</div>
-                <div class="price-pips">{potential_profit_pct:.1f}% potential</div>
-            </div>
-        </div>
+        """ + PRICE_GRID_HTML + """
         
         <div style="margin: 1.5rem 0;">
             <div class="price-label">Hold Time Estimate</div>
             <div style="font-size: 1.2rem; font-weight: 600; color: #374151;">
-                {signal.hold_time_days:.1f} days ({signal.hold_time_hours:.1f} hours)
+                {hold_time_days:.1f} days ({hold_time_hours:.1f} hours)
             </div>
             <div style="font-size: 0.9rem; color: #6b7280; margin-top: 0.3rem;">
-                {signal.hold_time_confidence} confidence
+                {hold_time_confidence} confidence
             </div>
         </div>
         
         <div style="margin: 1.5rem 0; padding: 1rem; background: rgba(255,255,255,0.5); border-radius: 15px;">
             <div class="price-label">Analysis</div>
             <div style="font-size: 0.95rem; color: #374151; line-height: 1.5;">
-                {signal.reason}
+                {reason}
             </div>
         </div>
         
-        <div class="action-buttons">
-            <button class="btn-execute" onclick="alert('Execute trade for {signal.pair}')">
-                🚀 Execute Trade
-            </button>
-            <button class="btn-details" onclick="alert('Show details for {signal.pair}')">
-                📊 View Details
-            </button>
-        </div>
+        """ + ACTION_BUTTONS_HTML + """
     </div>
-    """, unsafe_allow_html=True)
+"""
 
-def render_account_summary():
-    """Render account summary with beautiful cards"""
-    if not MODULES_AVAILABLE:
-        st.warning("⚠️ Trading modules not available")
-        return
+# Signal fields used by the card, in cache-key order
+SIGNAL_CARD_FIELDS = (
+    'pair', 'signal_type', 'entry_price', 'target_price', 'stop_loss', 'confidence',
+    'pips_target', 'pips_risk', 'risk_reward_ratio', 'hold_time_days', 'hold_time_hours',
+    'hold_time_confidence', 'reason'
+)
+
+@lru_cache(maxsize=128)
+def _render_signal_card_html(card_fields):
+    """Build card HTML from a hashable tuple of signal fields"""
+    fields = dict(zip(SIGNAL_CARD_FIELDS, card_fields))
+    signal_type = fields['signal_type'].upper()
     
-    try:
-        trader = OANDATrader()
-        account_info = trader.get_account_summary()
-        
-        if account_info:
-            balance = float(account_info.get('balance', 0))
-            nav = float(account_info.get('NAV', 0))
-            unrealized_pnl = float(account_info.get('unrealizedPL', 0))
-            margin_used = float(account_info.get('marginUsed', 0))
-            open_trades = int(account_info.get('openTradeCount', 0))
-            
-            st.markdown("""
+    # Calculate potential profit
+    if signal_type == "BUY":
+        potential_profit = fields['target_price'] - fields['entry_price']
+    else:
+        potential_profit = fields['entry_price'] - fields['target_price']
+    
+    # Derived values are computed here so the template only substitutes
+    fields.update(
+        signal_type=signal_type,
+        card_class="signal-card-buy" if signal_type == "BUY" else "signal-card-sell",
+        type_class="signal-type-buy" if signal_type == "BUY" else "signal-type-sell",
+        confidence_pct=fields['confidence'] * 100,
+        potential_profit_pct=(potential_profit / fields['entry_price']) * 100
+    )
+    return SIGNAL_CARD_TEMPLATE.format_map(fields)
+
+def signal_card_html(signal):
+    """Return the HTML for a beautiful signal card (unchanged signals hit the cache)"""
+    return _render_signal_card_html(tuple(getattr(signal, name) for name in SIGNAL_CARD_FIELDS))
+
+def signals_dataframe(signals):
+    """Flatten signals into one columnar DataFrame for st.dataframe"""
+    return pd.DataFrame({
+        'Pair': [signal.pair for signal in signals],
+        'Type': [signal.signal_type.upper() for signal in signals],
+        'Confidence': [f"{signal.confidence:.1%}" for signal in signals],
+        'Entry': [f"{signal.entry_price:.5f}" for signal in signals],
+        'Target': [f"{signal.target_price:.5f}" for signal in signals],
+        'Stop Loss': [f"{signal.stop_loss:.5f}" for signal in signals],
+        'Pips (T/R)': [f"+{signal.pips_target} / -{signal.pips_risk}" for signal in signals],
+        'R/R': [signal.risk_reward_ratio for signal in signals],
+        'Hold (days)': [round(signal.hold_time_days, 1) for signal in signals]
+    })
+
+def highlight_signal_row(row):
+    """Tint BUY rows green and SELL rows red"""
+    color = '#e8ffee' if row['Type'] == 'BUY' else '#ffeaea'
+    return [f'background-color: {color}'] * len(row)
+
+# Account overview cards - compiled once, rendered by render_account_summary
+ACCOUNT_SUMMARY_TEMPLATE = Template("""
             <div class="account-grid">
                 <div class="account-card">
                     <div class="account-title">Account Balance</div>
-                    <div class="account-value">$%s</div>
+                    <div class="account-value">${{ "{:,.2f}".format(balance) }}</div>
                 </div>
                 <div class="account-card">
                     <div class="account-title">Net Asset Value</div>
-                    <div class="account-value">$%s</div>
-                    <div class="account-change %s">%s$%.2f</div>
+                    <div class="account-value">${{ "{:,.2f}".format(nav) }}</div>
+                    <div class="account-change {{ pnl_class }}">{{ pnl_sign }}${{ "{:.2f}".format(unrealized_pnl) }}</div>
                 </div>
                 <div class="account-card">
                     <div class="account-title">Unrealized P&L</div>
-                    <div class="account-value %s">$%.2f</div>
+                    <div class="account-value {{ pnl_class }}">${{ "{:.2f}".format(unrealized_pnl) }}</div>
                 </div>
                 <div class="account-card">
                     <div class="account-title">Open Trades</div>
-                    <div class="account-value">%d</div>
-                    <div class="account-change">$%.2f margin used</div>
+                    <div class="account-value">{{ open_trades }}</div>
+                    <div class="account-change">${{ "{:.2f}".format(margin_used) }} margin used</div>
                 </div>
             </div>
-            """ % (
-                f"{balance:,.2f}",
-                f"{nav:,.2f}",
-                "positive" if unrealized_pnl >= 0 else "negative",
-                "+" if unrealized_pnl >= 0 else "",
-                unrealized_pnl,
-                "positive" if unrealized_pnl >= 0 else "negative",
-                unrealized_pnl,
-                open_trades,
-                margin_used
+            """)
+
+@st.cache_data(ttl=15)
+def get_account_info():
+    """Account summary shared by every rerun inside a 15 second window"""
+    return get_trader().get_account_summary()
+
+def render_account_summary():
+    """Render account summary with beautiful cards"""
+    if not MODULES_AVAILABLE:
+        st.warning("⚠️ Trading modules not available")
+        return
+    
+    try:
+        if get_trader() is None:
+            st.error("❌ Please set OANDA_API_KEY and OANDA_ACCOUNT_ID environment variables")
+            return
+        
+        account_info = get_account_info()
+        
+        if account_info:
+            # OANDATrader.get_account_summary already returns parsed, snake_case fields
+            unrealized_pnl = float(account_info.get('unrealized_pl', 0))
+            
+            st.markdown(ACCOUNT_SUMMARY_TEMPLATE.render(
+                balance=float(account_info.get('balance', 0)),
+                nav=float(account_info.get('nav', 0)),
+                unrealized_pnl=unrealized_pnl,
+                margin_used=float(account_info.get('margin_used', 0)),
+                open_trades=int(account_info.get('open_trade_count', 0)),
+                pnl_class="positive" if unrealized_pnl >= 0 else "negative",
+                pnl_sign="+" if unrealized_pnl >= 0 else ""
             ), unsafe_allow_html=True)
         else:
             st.error("❌ Could not fetch account information")
@@ -692,17 +794,56 @@ def render_account_summary():
     except Exception as e:
         st.error(f"❌ Error fetching account data: {e}")
 
+# How long the signals panel waits between checks on a running generation
+SIGNAL_POLL_SECONDS = 0.5
+# How long a fresh job may finish inline before the panel falls back to polling
+SIGNAL_WARM_WAIT_SECONDS = 0.05
+
+@st.cache_resource
+def get_signal_pool():
+    """Background workers for signal generation, shared across sessions"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def poll_live_signals(min_confidence):
+    """Return signals if ready, otherwise start/continue a background job and return None"""
+    # confidence -> (submitted at, future); a finished job is reused until the
+    # get_live_signals TTL runs out, so widget reruns don't wait on a new one
+    jobs = st.session_state.setdefault("signal_jobs", {})
+    submitted_at, future = jobs.get(min_confidence, (0.0, None))
+    if future is None or (future.done() and time.monotonic() - submitted_at >= LIVE_SIGNALS_TTL_SECONDS):
+        future = get_signal_pool().submit(get_live_signals, min_confidence)
+        jobs[min_confidence] = (time.monotonic(), future)
+        # Warm get_live_signals cache entries come back almost immediately
+        wait([future], timeout=SIGNAL_WARM_WAIT_SECONDS)
+    
+    if not future.done():
+        return None
+    
+    return future.result()
+
+def rerun_signals_panel():
+    """Rerun just the signals fragment where supported, else the whole app"""
+    try:
+        st.rerun(scope="fragment")
+    except (TypeError, StreamlitAPIException):
+        # Older Streamlit (no scope argument), or a full-script run where
+        # fragment scope is rejected
+        st.rerun()
+
+# Partial reruns need Streamlit 1.37+; older versions just rerun the whole script
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@fragment
 def render_live_signals():
-    """Render live trading signals"""
-    st.markdown('<div class="modern-card">', unsafe_allow_html=True)
-    
+    """Render live trading signals (reruns on its own when its widgets change)"""
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown("### 🎯 Live Trading Signals")
     with col2:
         if st.button("🔄 Refresh", key="refresh_signals"):
-            st.cache_data.clear()
-            st.rerun()
+            # The button click already reruns this panel - just drop the cached signals
+            get_live_signals.clear()
+            st.session_state.pop("signal_jobs", None)
     
     # Confidence threshold slider
     confidence_threshold = st.slider(
@@ -715,18 +856,126 @@ def render_live_signals():
         key="confidence_slider"
     )
     
-    with st.spinner("🔍 Analyzing markets..."):
-        signals = get_live_signals(confidence_threshold)
+    signals = poll_live_signals(confidence_threshold)
+    if signals is None:
+        # Still generating in the background - show a placeholder and check again shortly
+        st.info("🔍 Analyzing markets...")
+        time.sleep(SIGNAL_POLL_SECONDS)
+        rerun_signals_panel()
     
     if signals:
         st.success(f"✅ Found {len(signals)} high-quality signals!")
         
-        for i, signal in enumerate(signals):
-            render_signal_card(signal, i)
+        # Columnar table is the fast default view
+        st.dataframe(
+            signals_dataframe(signals).style.apply(highlight_signal_row, axis=1),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        if st.toggle("📊 Show signal cards", key="show_signal_cards"):
+            # Card container, every card and its closing tag go out as one element
+            html = ['<div class="modern-card">']
+            html.extend(signal_card_html(signal) for signal in signals)
+            html.append('</div>')
+            st.markdown("".join(html), unsafe_allow_html=True)
     else:
         st.info("📊 No signals meet the current confidence threshold. Try lowering the threshold or check back later.")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.cache_data(ttl=3600)
+def get_demo_performance():
+    """Deterministic demo balance curve for the Account tab"""
+    dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
+    idx = np.arange(len(dates))
+    sign = np.where(idx % 7 < 5, 1.0, -1.0)
+    balance = 1000 + (dates - dates[0]).days.values * 2.5 + idx * 0.1 * sign
+    return pd.DataFrame({'Date': dates, 'Balance': balance})
+
+# Transparent chart styling shared by every figure
+CHART_LAYOUT = dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font_color='#374151'
+)
+
+# Non-interactive demo charts skip Plotly's hover/zoom handlers and mode bar
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Line charts at or above this many points are drawn with WebGL instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+# Longer series are downsampled (LTTB) to this many points before plotting
+MAX_CHART_POINTS = 2000
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the line's shape"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    every = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int(np.floor((i + 1) * every)) + 1
+        next_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Keep the point in this bucket forming the largest triangle with the last kept point
+        start = int(np.floor(i * every)) + 1
+        end = next_start
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    
+    return indices
+
+def downsample_series(df, x_col, y_col, max_points=MAX_CHART_POINTS):
+    """Return df reduced to at most max_points rows using LTTB"""
+    if len(df) <= max_points:
+        return df
+    x = df[x_col]
+    x = x.astype('int64').to_numpy(dtype=float) if pd.api.types.is_datetime64_any_dtype(x) else x.to_numpy(dtype=float)
+    return df.iloc[lttb_indices(x, df[y_col].to_numpy(dtype=float), max_points)]
+
+@st.cache_data
+def get_performance_figure():
+    """Account balance line chart (built once - inputs are static demo data)"""
+    import plotly.express as px  # Deferred - only the Account and Analytics tabs draw charts
+    performance = downsample_series(get_demo_performance(), 'Date', 'Balance')
+    fig = px.line(performance, x='Date', y='Balance', title='Account Balance Over Time')
+    if len(performance) >= WEBGL_MIN_POINTS:
+        fig.update_traces(type='scattergl')
+    fig.update_layout(**CHART_LAYOUT)
+    return fig
+
+@st.cache_data
+def get_signal_distribution_figure():
+    """Demo pie chart for signal types"""
+    import plotly.express as px
+    signal_data = pd.DataFrame({
+        'Type': ['BUY', 'SELL'],
+        'Count': [7, 5]
+    })
+    fig = px.pie(signal_data, values='Count', names='Type', title='Signal Distribution')
+    fig.update_layout(**CHART_LAYOUT)
+    return fig
+
+@st.cache_data
+def get_pair_signals_figure():
+    """Demo bar chart for currency pairs"""
+    import plotly.express as px
+    pairs_data = pd.DataFrame({
+        'Pair': ['EUR/USD', 'GBP/USD', 'USD/JPY', 'AUD/USD'],
+        'Signals': [4, 3, 3, 2]
+    })
+    fig = px.bar(pairs_data, x='Pair', y='Signals', title='Signals by Currency Pair')
+    fig.update_layout(**CHART_LAYOUT)
+    return fig
 
 def render_quick_stats():
     """Render quick statistics"""
@@ -749,8 +998,48 @@ def render_quick_stats():
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+# Bot settings defaults - the live copy is one dict in st.session_state["settings"]
+DEFAULT_SETTINGS = {
+    "min_conf_setting": 0.25,
+    "max_signals_setting": 10,
+    "risk_level_setting": "Conservative",
+    "email_alerts": True,
+    "push_notifications": True,
+    "sms_alerts": False,
+    "position_size": 1000,
+    "max_risk": 2
+}
+RISK_LEVELS = ["Conservative", "Moderate", "Aggressive"]
+SETTINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'configs', 'ui_settings.json')
+
+def get_settings():
+    """Session settings dict, seeded from saved settings (or defaults) once per session"""
+    if "settings" not in st.session_state:
+        settings = DEFAULT_SETTINGS.copy()
+        try:
+            with open(SETTINGS_PATH) as f:
+                settings.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        st.session_state.settings = settings
+    return st.session_state.settings
+
+def commit_setting(key):
+    """Widget on_change callback: copy the changed widget value into the settings dict"""
+    get_settings()[key] = st.session_state[key]
+
+def save_settings(settings):
+    """Flush the settings dict to disk"""
+    try:
+        with open(SETTINGS_PATH, 'w') as f:
+            f.write(json.dumps(settings, indent=2))
+    except OSError as e:
+        logger.error(f"Error saving settings: {e}")
+
 def main():
     """Main application"""
+    inject_css()
+    
     # Render header
     render_header()
     
@@ -774,20 +1063,7 @@ def main():
         st.markdown('<div class="modern-card">', unsafe_allow_html=True)
         st.markdown("### 📈 Performance Chart")
         
-        # Demo performance data
-        dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
-        performance = pd.DataFrame({
-            'Date': dates,
-            'Balance': 1000 + (dates - dates[0]).days * 2.5 + pd.Series(range(len(dates))).apply(lambda x: x * 0.1 * (1 if x % 7 < 5 else -1))
-        })
-        
-        fig = px.line(performance, x='Date', y='Balance', title='Account Balance Over Time')
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='#374151'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(get_performance_figure(), use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with tab3:
@@ -797,36 +1073,15 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            # Demo pie chart for signal types
-            signal_data = pd.DataFrame({
-                'Type': ['BUY', 'SELL'],
-                'Count': [7, 5]
-            })
-            fig = px.pie(signal_data, values='Count', names='Type', title='Signal Distribution')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#374151'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(get_signal_distribution_figure(), use_container_width=True, config=STATIC_CHART_CONFIG)
         
         with col2:
-            # Demo bar chart for currency pairs
-            pairs_data = pd.DataFrame({
-                'Pair': ['EUR/USD', 'GBP/USD', 'USD/JPY', 'AUD/USD'],
-                'Signals': [4, 3, 3, 2]
-            })
-            fig = px.bar(pairs_data, x='Pair', y='Signals', title='Signals by Currency Pair')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#374151'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(get_pair_signals_figure(), use_container_width=True, config=STATIC_CHART_CONFIG)
         
         st.markdown('</div>', unsafe_allow_html=True)
     
     with tab4:
+        settings = get_settings()
         st.markdown('<div class="modern-card">', unsafe_allow_html=True)
         st.markdown("### ⚙️ Bot Settings")
         
@@ -834,24 +1089,25 @@ def main():
         
         with col1:
             st.markdown("#### 🎯 Signal Settings")
-            st.slider("Minimum Confidence", 0.1, 0.9, 0.25, key="min_conf_setting")
-            st.slider("Max Daily Signals", 1, 20, 10, key="max_signals_setting")
-            st.selectbox("Risk Level", ["Conservative", "Moderate", "Aggressive"], key="risk_level_setting")
+            st.slider("Minimum Confidence", 0.1, 0.9, settings["min_conf_setting"], key="min_conf_setting", on_change=commit_setting, args=("min_conf_setting",))
+            st.slider("Max Daily Signals", 1, 20, settings["max_signals_setting"], key="max_signals_setting", on_change=commit_setting, args=("max_signals_setting",))
+            st.selectbox("Risk Level", RISK_LEVELS, index=RISK_LEVELS.index(settings["risk_level_setting"]), key="risk_level_setting", on_change=commit_setting, args=("risk_level_setting",))
         
         with col2:
             st.markdown("#### 🔔 Notifications")
-            st.checkbox("Email Alerts", value=True, key="email_alerts")
-            st.checkbox("Push Notifications", value=True, key="push_notifications")
-            st.checkbox("SMS Alerts", value=False, key="sms_alerts")
+            st.checkbox("Email Alerts", value=settings["email_alerts"], key="email_alerts", on_change=commit_setting, args=("email_alerts",))
+            st.checkbox("Push Notifications", value=settings["push_notifications"], key="push_notifications", on_change=commit_setting, args=("push_notifications",))
+            st.checkbox("SMS Alerts", value=settings["sms_alerts"], key="sms_alerts", on_change=commit_setting, args=("sms_alerts",))
         
         st.markdown("#### 💰 Trading Settings")
         col3, col4 = st.columns(2)
         with col3:
-            st.number_input("Position Size ($)", min_value=100, max_value=10000, value=1000, key="position_size")
+            st.number_input("Position Size ($)", min_value=100, max_value=10000, value=settings["position_size"], key="position_size", on_change=commit_setting, args=("position_size",))
         with col4:
-            st.number_input("Max Risk per Trade (%)", min_value=1, max_value=10, value=2, key="max_risk")
+            st.number_input("Max Risk per Trade (%)", min_value=1, max_value=10, value=settings["max_risk"], key="max_risk", on_change=commit_setting, args=("max_risk",))
         
         if st.button("💾 Save Settings", key="save_settings"):
+            save_settings(settings)
             st.success("✅ Settings saved successfully!")
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -4,16 +4,39 @@
 Ensures perfect linear scaling: 10x capital = 10x profits
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from optimized_advanced_backtest import OptimizedAdvancedBacktest
+if __package__:
+    from .optimized_advanced_backtest import OptimizedAdvancedBacktest
+    from ._position_size_jit import (
+        calc_position_size, sizing_constants, quality_multiplier as get_quality_multiplier,
+        SESSION_IDS, OTHER_SESSION_ID, SESSION_MULTIPLIERS,
+        STRENGTH_IDS, OTHER_STRENGTH_ID, STRENGTH_MULTIPLIERS
+    )
+else:
+    # Run directly as a script (src/ is already sys.path[0])
+    from optimized_advanced_backtest import OptimizedAdvancedBacktest
+    from _position_size_jit import (
+        calc_position_size, sizing_constants, quality_multiplier as get_quality_multiplier,
+        SESSION_IDS, OTHER_SESSION_ID, SESSION_MULTIPLIERS,
+        STRENGTH_IDS, OTHER_STRENGTH_ID, STRENGTH_MULTIPLIERS
+    )
 from datetime import datetime
+from pathlib import Path
+import importlib.util
+import os
+import numpy as np
+import pandas as pd
 import logging
 
+# Parquet price cache (optional) - pyarrow is only used through pandas
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
 logger = logging.getLogger(__name__)
 
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+# Downloaded hourly bars are kept here between runs, one file per pair and window
+PRICE_CACHE_DIR = Path(os.getenv('PRICE_CACHE_DIR', 'cache'))
+
 class LinearScaledBacktest(OptimizedAdvancedBacktest):
     """
     Linear scaling backtest that ensures perfect proportional results
@@ -24,67 +47,84 @@ class LinearScaledBacktest(OptimizedAdvancedBacktest):
         self.base_balance = 1000  # Reference balance for linear scaling
         self.scale_factor = initial_balance / self.base_balance
         self.original_balance = initial_balance  # Store original balance
+        self._update_sizing_constants()
+        self._pending_trades = []
         
         logger.info(f"🎯 Linear Scaled Backtest initialized with {self.scale_factor:.1f}x scaling")
     
+    def get_forex_data(self, pair: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Get forex data, reading closed windows from the on-disk parquet cache when present."""
+        if not PARQUET_AVAILABLE or end_date > datetime.now():
+            return super().get_forex_data(pair, start_date, end_date)
+        
+        cache_path = PRICE_CACHE_DIR / '{}_{:%Y%m%d%H}_{:%Y%m%d%H}.parquet'.format(
+            pair.replace('/', ''), start_date, end_date)
+        if cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path, memory_map=True)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable price cache {cache_path}: {e}")
+        
+        data = super().get_forex_data(pair, start_date, end_date)
+        if not data.empty:
+            try:
+                PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                data.to_parquet(cache_path, compression='zstd')
+            except Exception as e:
+                logger.warning(f"Could not write price cache {cache_path}: {e}")
+        return data
+    
+    def load_data(self, pairs, start_date: datetime, end_date: datetime) -> dict:
+        """Load pair data with OHLC bars downcast to float32 (ample for 5-decimal FX prices)."""
+        pair_data = super().load_data(pairs, start_date, end_date)
+        for pair, data in pair_data.items():
+            ohlc = [col for col in PRICE_COLUMNS if col in data.columns]
+            pair_data[pair] = data.astype({col: np.float32 for col in ohlc}, copy=False)
+        return pair_data
+    
+    def reset(self, initial_balance: float):
+        """Rescale to a new account size and clear results, keeping loaded state."""
+        self.initial_balance = initial_balance
+        self.current_balance = initial_balance
+        self.original_balance = initial_balance
+        self.scale_factor = initial_balance / self.base_balance
+        self._update_sizing_constants()
+        
+        self.executed_trades = []
+        self.all_signals = []
+        self.filtered_signals = []
+        self.rejected_signals = []
+        self.reset_journal()
+        self._pending_trades = []
+    
+    def _update_sizing_constants(self):
+        """Precompute the per-account sizing bounds once instead of per signal."""
+        self._sizing_args = sizing_constants(self.scale_factor, self.base_balance,
+                                             self.original_balance, self.base_risk_pct)
+        _, self._base_risk, self._base_risk_cap, self._min_risk, self._risk_cap, self._max_units = self._sizing_args
+    
     def calculate_optimized_position_size(self, signal: dict, quality_score: float) -> dict:
         """Calculate position size with perfect linear scaling."""
         try:
             # ALWAYS use original balance for consistent scaling
             # This prevents compound effects from affecting scaling
-            base_risk = self.base_balance * self.base_risk_pct  # Always use $1,000 base
-            
-            # Quality multiplier (consistent across all account sizes)
-            if quality_score > 0.7:
-                quality_multiplier = 1.4
-            elif quality_score > 0.6:
-                quality_multiplier = 1.2
-            elif quality_score > 0.5:
-                quality_multiplier = 1.0
-            else:
-                quality_multiplier = 0.8
-            
-            # Session multiplier (consistent)
-            if signal['session_name'] == "London-NY Overlap":
-                session_multiplier = 1.3
-            elif signal['session_name'] in ["London Session", "NY Session"]:
-                session_multiplier = 1.15
-            elif signal['session_name'] == "Asian Session":
-                session_multiplier = 1.0
-            else:
-                session_multiplier = 0.85
-            
-            # Technical strength multiplier (consistent)
-            if signal['technical_strength'] == 'strong':
-                strength_multiplier = 1.2
-            elif signal['technical_strength'] == 'moderate':
-                strength_multiplier = 1.1
-            else:
-                strength_multiplier = 1.0
-            
-            # Calculate base risk for $1,000 account
-            base_final_risk = base_risk * quality_multiplier * session_multiplier * strength_multiplier
-            base_final_risk = max(15, min(base_final_risk, self.base_balance * 0.1))
+            session_id = SESSION_IDS.get(signal['session_name'], OTHER_SESSION_ID)
+            strength_id = STRENGTH_IDS.get(signal['technical_strength'], OTHER_STRENGTH_ID)
             
-            # Scale linearly by account size (using ORIGINAL balance, not current)
-            final_risk = base_final_risk * self.scale_factor
-            final_risk = max(15 * self.scale_factor, min(final_risk, self.original_balance * 0.1))
+            # Numeric core runs in the (optionally) compiled kernel
+            units, final_risk, base_units = calc_position_size(
+                float(quality_score), session_id, strength_id, float(signal['pips_risk']),
+                *self._sizing_args
+            )
             
-            # Calculate units (scales linearly)
-            stop_distance_pips = signal['pips_risk']
-            pip_value_usd = 0.10  # $0.10 per pip for 1000 units
-            
-            base_units = int(base_final_risk / (stop_distance_pips * pip_value_usd))
-            base_units = max(1000, min(base_units, 150000))
-            
-            # Scale units linearly
-            units = int(base_units * self.scale_factor)
-            units = max(1000, min(units, 150000 * int(self.scale_factor)))
+            quality_multiplier = get_quality_multiplier(float(quality_score))
+            session_multiplier = SESSION_MULTIPLIERS[session_id]
+            strength_multiplier = STRENGTH_MULTIPLIERS[strength_id]
             
             return {
-                'units': units,
+                'units': int(units),
                 'risk_amount': final_risk,
-                'base_units': base_units,
+                'base_units': int(base_units),
                 'scale_factor': self.scale_factor,
                 'quality_multiplier': quality_multiplier,
                 'session_multiplier': session_multiplier,
@@ -101,17 +141,105 @@ class LinearScaledBacktest(OptimizedAdvancedBacktest):
                 'scale_factor': self.scale_factor
             }
 
-def run_linear_scaled_backtest(initial_balance: float = 10000):
-    """Run the linear scaled backtest."""
+    def execute_candidate_trade(self, signal: dict, quality_analysis: dict, position_info: dict, future_data):
+        """Queue the trade - linear sizing never depends on earlier outcomes, so
+        all trades can be simulated together in flush_candidate_trades."""
+        self._pending_trades.append((signal, quality_analysis, position_info, future_data))
+    
+    def flush_candidate_trades(self):
+        """Simulate every queued trade in one parallel batch, then record in order."""
+        pending, self._pending_trades = self._pending_trades, []
+        if not pending:
+            return
+        
+        signals, quality_analyses, position_infos, future_frames = zip(*pending)
+        try:
+            trade_results = self.simulate_optimized_trades(list(signals), list(position_infos), list(future_frames))
+        except Exception as e:
+            logger.error(f"Batch trade simulation failed, simulating one by one: {e}")
+            trade_results = [self.simulate_optimized_trade(*args) for args in zip(signals, position_infos, future_frames)]
+        
+        for signal, quality_analysis, position_info, trade_result in zip(signals, quality_analyses, position_infos, trade_results):
+            self.record_trade(signal, quality_analysis, position_info, trade_result)
+    
+    def calculate_optimized_position_size_batch(self, signals_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized calculate_optimized_position_size for a batch of signals.
+        
+        Expects columns session_name, technical_strength, quality_score and
+        pips_risk; returns one row of sizing results per signal.
+        """
+        quality = signals_df['quality_score'].to_numpy(dtype=float)
+        pips_risk = signals_df['pips_risk'].to_numpy(dtype=float)
+        
+        session_ids = signals_df['session_name'].map(SESSION_IDS).fillna(OTHER_SESSION_ID).to_numpy(dtype=int)
+        strength_ids = signals_df['technical_strength'].map(STRENGTH_IDS).fillna(OTHER_STRENGTH_ID).to_numpy(dtype=int)
+        
+        quality_multiplier = np.select([quality > 0.7, quality > 0.6, quality > 0.5], [1.4, 1.2, 1.0], default=0.8)
+        session_multiplier = np.asarray(SESSION_MULTIPLIERS)[session_ids]
+        strength_multiplier = np.asarray(STRENGTH_MULTIPLIERS)[strength_ids]
+        total_multiplier = quality_multiplier * session_multiplier * strength_multiplier
+        
+        # Same clamps as the scalar path, one pass over the whole batch. Spelled
+        # max(lower, min(x, upper)) like the kernel rather than np.clip, so the
+        # lower bound still wins when a small account makes upper < lower
+        # (max_units is 0 below a $1,000 scale)
+        base_final_risk = np.maximum(np.minimum(self._base_risk * total_multiplier, self._base_risk_cap), 15)
+        final_risk = np.maximum(np.minimum(base_final_risk * self.scale_factor, self._risk_cap), self._min_risk)
+        
+        base_units = np.maximum(np.minimum(np.trunc(base_final_risk / (pips_risk * 0.10)), 150000), 1000).astype(np.int64)
+        units = np.maximum(np.minimum(np.trunc(base_units * self.scale_factor), self._max_units), 1000).astype(np.int64)
+        
+        return pd.DataFrame({
+            'units': units,
+            'risk_amount': final_risk,
+            'base_units': base_units,
+            'scale_factor': self.scale_factor,
+            'quality_multiplier': quality_multiplier,
+            'session_multiplier': session_multiplier,
+            'strength_multiplier': strength_multiplier,
+            'compound_multiplier': 1.0,  # Always 1.0 for linear scaling
+            'total_multiplier': total_multiplier
+        }, index=signals_df.index)
+
+BACKTEST_PAIRS = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD', 'NZD/USD']
+BACKTEST_START = datetime(2024, 12, 1)
+BACKTEST_END = datetime(2024, 12, 15)
+
+SCALING_REPORT = """
+🔍 LINEAR SCALING VERIFICATION:
+   $1,000 Profit: ${p1k:,.2f}
+   $10,000 Profit: ${p10k:,.2f}
+   Expected 10x: ${expected:,.2f}
+   Actual Ratio: {ratio:.2f}x
+   {verdict}
+
+📊 DETAILED COMPARISON:
+   Trade Count: {trades_1k} vs {trades_10k}
+   Win Rate: {win_rate_1k:.1%} vs {win_rate_10k:.1%}
+   Avg Win: ${avg_win_1k:.2f} vs ${avg_win_10k:.2f}
+   Avg Loss: ${avg_loss_1k:.2f} vs ${avg_loss_10k:.2f}
+"""
+
+def run_linear_scaled_backtest(initial_balance: float = 10000, backtest: LinearScaledBacktest = None,
+                               pair_data: dict = None):
+    """
+    Run the linear scaled backtest.
+    
+    Pass a previous backtest and its loaded pair_data to sweep balances
+    without re-downloading prices; only the sizing changes with scale.
+    """
     try:
         # Initialize with specified balance
-        backtest = LinearScaledBacktest(initial_balance=initial_balance)
+        if backtest is None:
+            backtest = LinearScaledBacktest(initial_balance=initial_balance)
+        else:
+            backtest.reset(initial_balance)
         
-        pairs = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD', 'NZD/USD']
-        start_date = datetime(2024, 12, 1)
-        end_date = datetime(2024, 12, 15)
+        if pair_data is None:
+            pair_data = backtest.load_data(BACKTEST_PAIRS, BACKTEST_START, BACKTEST_END)
         
-        results = backtest.run_optimized_backtest(pairs, start_date, end_date)
+        results = backtest.run_on_data(pair_data, BACKTEST_PAIRS, BACKTEST_START, BACKTEST_END)
         
         # Add scaling information
         results['scale_factor'] = backtest.scale_factor
@@ -128,32 +256,38 @@ if __name__ == "__main__":
     print("💰 Perfect Linear Scaling Test")
     print("=" * 60)
     
+    # Load prices once - both account sizes trade the same price path
+    backtest = LinearScaledBacktest(initial_balance=1000)
+    pair_data = backtest.load_data(BACKTEST_PAIRS, BACKTEST_START, BACKTEST_END)
+    
     # Test with $1,000
     print("\n📊 Testing $1,000 account...")
-    results_1k = run_linear_scaled_backtest(1000)
+    results_1k = run_linear_scaled_backtest(1000, backtest, pair_data)
     
     # Test with $10,000
     print("\n📊 Testing $10,000 account...")
-    results_10k = run_linear_scaled_backtest(10000)
+    results_10k = run_linear_scaled_backtest(10000, backtest, pair_data)
     
     if 'error' not in results_1k and 'error' not in results_10k:
-        print(f"\n🔍 LINEAR SCALING VERIFICATION:")
-        print(f"   $1,000 Profit: ${results_1k['total_profit']:,.2f}")
-        print(f"   $10,000 Profit: ${results_10k['total_profit']:,.2f}")
-        print(f"   Expected 10x: ${results_1k['total_profit'] * 10:,.2f}")
-        print(f"   Actual Ratio: {results_10k['total_profit'] / results_1k['total_profit']:.2f}x")
-        
-        if abs(results_10k['total_profit'] / results_1k['total_profit'] - 10.0) < 0.1:
-            print(f"   ✅ PERFECT LINEAR SCALING ACHIEVED!")
-        else:
-            print(f"   ⚠️  Scaling deviation detected")
-            
-        # Show detailed comparison
-        print(f"\n📊 DETAILED COMPARISON:")
-        print(f"   Trade Count: {results_1k['total_trades']} vs {results_10k['total_trades']}")
-        print(f"   Win Rate: {results_1k['win_rate']:.1%} vs {results_10k['win_rate']:.1%}")
-        print(f"   Avg Win: ${results_1k['avg_win']:.2f} vs ${results_10k['avg_win']:.2f}")
-        print(f"   Avg Loss: ${results_1k['avg_loss']:.2f} vs ${results_10k['avg_loss']:.2f}")
+        ratio = results_10k['total_profit'] / results_1k['total_profit']
+        
+        # Format the whole verification report in one pass
+        print(SCALING_REPORT.format_map({
+            'p1k': results_1k['total_profit'],
+            'p10k': results_10k['total_profit'],
+            'expected': results_1k['total_profit'] * 10,
+            'ratio': ratio,
+            'verdict': ("✅ PERFECT LINEAR SCALING ACHIEVED!" if abs(ratio - 10.0) < 0.1
+                        else "⚠️  Scaling deviation detected"),
+            'trades_1k': results_1k['total_trades'],
+            'trades_10k': results_10k['total_trades'],
+            'win_rate_1k': results_1k['win_rate'],
+            'win_rate_10k': results_10k['win_rate'],
+            'avg_win_1k': results_1k['avg_win'],
+            'avg_win_10k': results_10k['avg_win'],
+            'avg_loss_1k': results_1k['avg_loss'],
+            'avg_loss_10k': results_10k['avg_loss']
+        }), end='')
         
     else:
         print(f"❌ Error in one or both tests")
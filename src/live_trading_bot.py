@@ -4,17 +4,24 @@
 Real-time trading with OANDA using optimized signals
 """
 
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 import time
+import heapq
 import logging
-from datetime import datetime, timedelta
-from oanda_trader import OANDATrader
-from forex_signal_generator import ForexSignalGenerator
-from simple_technical_analyzer import SimpleTechnicalAnalyzer
-import schedule
+import threading
+from types import MappingProxyType
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+if __package__:
+    from .oanda_trader import OANDATrader
+    from .forex_signal_generator import ForexSignalGenerator
+    from .simple_technical_analyzer import SimpleTechnicalAnalyzer
+else:
+    # Run directly as a script (src/ is already sys.path[0])
+    from oanda_trader import OANDATrader
+    from forex_signal_generator import ForexSignalGenerator
+    from simple_technical_analyzer import SimpleTechnicalAnalyzer
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +34,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SESSION_INTERVAL_SECONDS = 30 * 60  # Trading session every 30 minutes
+
+TRADING_PAIRS = ('EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD', 'NZD/USD')
+
+def _pair_meta(pair: str) -> tuple:
+    """(pip_value, stop_loss_pips, take_profit_pips) for a pair (simplified)."""
+    return (0.01 if 'JPY' in pair else 0.0001, 20, 40)
+
+# Per-pair pip metadata, built once at import
+PAIR_META = MappingProxyType({pair: _pair_meta(pair) for pair in TRADING_PAIRS})
+
+def _order_template(pair: str) -> dict:
+    """Constant place_order kwargs for a pair."""
+    _, stop_loss_pips, take_profit_pips = PAIR_META.get(pair) or _pair_meta(pair)
+    return {
+        'order_type': 'MARKET',
+        'stop_loss_pips': stop_loss_pips,
+        'take_profit_pips': take_profit_pips
+    }
+
+ORDER_WORKERS = 4           # Concurrent order submissions per session
+ORDER_STAGGER_SECONDS = 0.05  # Small gap between submissions (well under OANDA's rate limit)
+
+MARGIN_PCT = 0.02  # Estimated margin requirement for majors (50:1)
+
+def estimate_margin(pair: str, units: int, price: float) -> float:
+    """Estimate USD margin for a position (USD-base pairs are already in USD)."""
+    notional = units if pair.startswith('USD/') else units * price
+    return notional * MARGIN_PCT
+
 class LiveTradingBot:
     """Live trading bot for $10,000 virtual account."""
     
@@ -37,28 +74,40 @@ class LiveTradingBot:
         self.technical_analyzer = SimpleTechnicalAnalyzer()
         
         # Trading parameters (optimized from backtests)
-        self.pairs = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD', 'NZD/USD']
+        self.pairs = list(TRADING_PAIRS)
         self.min_confidence = 0.45  # 45% minimum confidence
         self.risk_per_trade = 0.03  # 3% risk per trade
         self.max_concurrent_trades = 8
         self.max_daily_trades = 12
         
+        # Per-pair constant order kwargs, built once
+        self._order_templates = {pair: _order_template(pair) for pair in self.pairs}
+        
         # Track daily trades
         self.daily_trades = 0
         self.last_trade_date = None
+        self._trade_lock = threading.Lock()  # Orders are dispatched concurrently
+        self._last_date_check = float('-inf')  # time.monotonic() of last date check
+        self._open_position_count = 0  # Open positions seen by the last session
         
         logger.info("🚀 Live Trading Bot initialized")
-        logger.info(f"📊 Trading pairs: {', '.join(self.pairs)}")
-        logger.info(f"🎯 Min confidence: {self.min_confidence*100:.0f}%")
-        logger.info(f"💰 Risk per trade: {self.risk_per_trade*100:.0f}%")
+        logger.info("📊 Trading pairs: %s", ', '.join(self.pairs))
+        logger.info("🎯 Min confidence: %.0f%%", self.min_confidence * 100)
+        logger.info("💰 Risk per trade: %.0f%%", self.risk_per_trade * 100)
     
     def reset_daily_counters(self):
         """Reset daily trade counters if new day."""
+        # The date can only change so often - check it at most once a minute
+        now_mono = time.monotonic()
+        if now_mono - self._last_date_check < 60:
+            return
+        self._last_date_check = now_mono
+        
         today = datetime.now().date()
         if self.last_trade_date != today:
             self.daily_trades = 0
             self.last_trade_date = today
-            logger.info(f"📅 New trading day: {today}")
+            logger.info("📅 New trading day: %s", today)
     
     def get_account_info(self):
         """Get current account information."""
@@ -69,10 +118,11 @@ class LiveTradingBot:
             margin_used = float(account_info.get('marginUsed', 0))
             margin_available = float(account_info.get('marginAvailable', 0))
             
-            logger.info(f"💰 Account Balance: ${balance:,.2f}")
-            logger.info(f"📊 NAV: ${nav:,.2f}")
-            logger.info(f"📈 Margin Used: ${margin_used:,.2f}")
-            logger.info(f"📉 Margin Available: ${margin_available:,.2f}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("💰 Account Balance: $%s", format(balance, ',.2f'))
+                logger.info("📊 NAV: $%s", format(nav, ',.2f'))
+                logger.info("📈 Margin Used: $%s", format(margin_used, ',.2f'))
+                logger.info("📉 Margin Available: $%s", format(margin_available, ',.2f'))
             
             return {
                 'balance': balance,
@@ -81,37 +131,32 @@ class LiveTradingBot:
                 'margin_available': margin_available
             }
         except Exception as e:
-            logger.error(f"❌ Error getting account info: {e}")
+            logger.error("❌ Error getting account info: %s", e)
             return None
     
     def get_open_positions(self):
         """Get current open positions."""
         try:
             positions = self.trader.get_positions()
-            open_positions = []
             
-            for position in positions:
-                if float(position.get('long', {}).get('units', 0)) != 0 or float(position.get('short', {}).get('units', 0)) != 0:
-                    open_positions.append(position)
+            # OANDA reports units as strings - an empty side is exactly '0'
+            open_positions = [
+                p for p in positions
+                if (p.get('long') or {}).get('units', '0') != '0'
+                or (p.get('short') or {}).get('units', '0') != '0'
+            ]
             
-            logger.info(f"📊 Open positions: {len(open_positions)}")
+            logger.info("📊 Open positions: %d", len(open_positions))
             return open_positions
         except Exception as e:
-            logger.error(f"❌ Error getting positions: {e}")
+            logger.error("❌ Error getting positions: %s", e)
             return []
     
     def calculate_position_size(self, account_balance: float, pair: str):
         """Calculate position size based on risk management."""
         risk_amount = account_balance * self.risk_per_trade
         
-        # Estimate pip value (simplified)
-        if 'JPY' in pair:
-            pip_value = 0.01  # For JPY pairs
-        else:
-            pip_value = 0.0001  # For other pairs
-        
-        # Assume 20 pip stop loss
-        stop_loss_pips = 20
+        pip_value, stop_loss_pips, _ = PAIR_META.get(pair) or _pair_meta(pair)
         position_size = int(risk_amount / (stop_loss_pips * pip_value))
         
         # Ensure minimum position size
@@ -120,10 +165,11 @@ class LiveTradingBot:
         
         position_size = max(min_size, min(position_size, max_size))
         
-        logger.info(f"📊 Position size for {pair}: {position_size:,} units")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Position size for %s: %s units", pair, format(position_size, ','))
         return position_size
     
-    def execute_trade(self, signal: dict, account_balance: float):
+    def execute_trade(self, signal: dict, account_balance: float, position_size: int = None):
         """Execute a trade based on signal."""
         try:
             pair = signal['pair']
@@ -131,45 +177,37 @@ class LiveTradingBot:
             confidence = signal['confidence']
             
             # Calculate position size
-            position_size = self.calculate_position_size(account_balance, pair)
+            if position_size is None:
+                position_size = self.calculate_position_size(account_balance, pair)
             
-            # Set stop loss and take profit (simplified)
-            if 'JPY' in pair:
-                stop_loss_pips = 20
-                take_profit_pips = 40
-            else:
-                stop_loss_pips = 20
-                take_profit_pips = 40
+            # Order type, stop loss and take profit are constant per pair
+            order_kwargs = self._order_templates.get(pair) or _order_template(pair)
             
-            logger.info(f"🎯 Executing {action} trade for {pair}")
-            logger.info(f"📊 Confidence: {confidence:.1%}")
-            logger.info(f"💰 Position size: {position_size:,} units")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎯 Executing %s trade for %s", action, pair)
+                logger.info("📊 Confidence: %.1f%%", confidence * 100)
+                logger.info("💰 Position size: %s units", format(position_size, ','))
             
             # Execute the trade
-            result = self.trader.place_order(
-                pair=pair,
-                units=position_size,
-                order_type='MARKET',
-                stop_loss_pips=stop_loss_pips,
-                take_profit_pips=take_profit_pips
-            )
+            result = self.trader.place_order(pair=pair, units=position_size, **order_kwargs)
             
             if result and 'orderFillTransaction' in result:
                 trade_id = result['orderFillTransaction']['id']
                 price = float(result['orderFillTransaction']['price'])
                 
-                logger.info(f"✅ Trade executed successfully!")
-                logger.info(f"📊 Trade ID: {trade_id}")
-                logger.info(f"💰 Entry price: {price}")
+                logger.info("✅ Trade executed successfully!")
+                logger.info("📊 Trade ID: %s", trade_id)
+                logger.info("💰 Entry price: %s", price)
                 
-                self.daily_trades += 1
+                with self._trade_lock:
+                    self.daily_trades += 1
                 return True
             else:
-                logger.error(f"❌ Trade execution failed: {result}")
+                logger.error("❌ Trade execution failed: %s", result)
                 return False
                 
         except Exception as e:
-            logger.error(f"❌ Error executing trade: {e}")
+            logger.error("❌ Error executing trade: %s", e)
             return False
     
     def scan_for_signals(self):
@@ -177,19 +215,24 @@ class LiveTradingBot:
         logger.info("🔍 Scanning for trading signals...")
         
         signals = []
-        for pair in self.pairs:
-            try:
-                # Generate signal for this pair
-                signal = self.signal_generator.generate_signal(pair)
-                
-                if signal and signal.get('confidence', 0) >= self.min_confidence:
-                    signals.append(signal)
-                    logger.info(f"🎯 Signal found: {pair} {signal['action']} ({signal['confidence']:.1%})")
-                
-            except Exception as e:
-                logger.error(f"❌ Error generating signal for {pair}: {e}")
         
-        logger.info(f"📊 Found {len(signals)} qualifying signals")
+        # Pairs are independent and network-bound - generate them concurrently
+        with ThreadPoolExecutor(max_workers=len(self.pairs)) as executor:
+            futures = {executor.submit(self.signal_generator.generate_signal, pair): pair for pair in self.pairs}
+            
+            for future in as_completed(futures):
+                pair = futures[future]
+                try:
+                    signal = future.result()
+                    
+                    if signal and signal.get('confidence', 0) >= self.min_confidence:
+                        signals.append(signal)
+                        logger.info("🎯 Signal found: %s %s (%.1f%%)", pair, signal['action'], signal['confidence'] * 100)
+                    
+                except Exception as e:
+                    logger.error("❌ Error generating signal for %s: %s", pair, e)
+        
+        logger.info("📊 Found %d qualifying signals", len(signals))
         return signals
     
     def trading_session(self):
@@ -201,23 +244,38 @@ class LiveTradingBot:
         
         # Check if we've hit daily trade limit
         if self.daily_trades >= self.max_daily_trades:
-            logger.info(f"⏸️ Daily trade limit reached ({self.daily_trades}/{self.max_daily_trades})")
-            return
-        
-        # Get account information
-        account_info = self.get_account_info()
-        if not account_info:
-            logger.error("❌ Could not get account information")
-            return
-        
-        # Get open positions
-        open_positions = self.get_open_positions()
-        if len(open_positions) >= self.max_concurrent_trades:
-            logger.info(f"⏸️ Maximum concurrent trades reached ({len(open_positions)}/{self.max_concurrent_trades})")
+            logger.info("⏸️ Daily trade limit reached (%d/%d)", self.daily_trades, self.max_daily_trades)
             return
         
-        # Scan for signals
-        signals = self.scan_for_signals()
+        # Account, positions and signal scan are independent REST calls - overlap them
+        executor = ThreadPoolExecutor(max_workers=3)
+        try:
+            account_future = executor.submit(self.get_account_info)
+            positions_future = executor.submit(self.get_open_positions)
+            
+            # Only scan speculatively if positions weren't already full last session
+            signals_future = None
+            if self._open_position_count < self.max_concurrent_trades:
+                signals_future = executor.submit(self.scan_for_signals)
+            
+            account_info = account_future.result()
+            open_positions = positions_future.result()
+            self._open_position_count = len(open_positions)
+            
+            if not account_info:
+                logger.error("❌ Could not get account information")
+                return
+            
+            if len(open_positions) >= self.max_concurrent_trades:
+                logger.info("⏸️ Maximum concurrent trades reached (%d/%d)", len(open_positions), self.max_concurrent_trades)
+                return
+            
+            if signals_future is None:
+                signals_future = executor.submit(self.scan_for_signals)
+            signals = signals_future.result()
+        finally:
+            # Don't hold the session for a scan whose result is no longer needed
+            executor.shutdown(wait=False, cancel_futures=True)
         
         if not signals:
             logger.info("📊 No qualifying signals found")
@@ -226,42 +284,60 @@ class LiveTradingBot:
         # Execute trades for top signals
         trades_to_execute = min(len(signals), self.max_daily_trades - self.daily_trades, self.max_concurrent_trades - len(open_positions))
         
-        # Sort signals by confidence
-        signals.sort(key=lambda x: x['confidence'], reverse=True)
+        # Pick the highest-confidence signals without sorting the rest
+        top_signals = heapq.nlargest(trades_to_execute, signals, key=lambda x: x['confidence'])
         
-        for i in range(trades_to_execute):
-            signal = signals[i]
-            success = self.execute_trade(signal, account_info['balance'])
-            
-            if success:
-                logger.info(f"✅ Trade {i+1}/{trades_to_execute} executed successfully")
-            else:
-                logger.error(f"❌ Trade {i+1}/{trades_to_execute} failed")
+        # Preflight margin locally so rejected orders never hit OANDA; margin is
+        # reserved up front because the orders below are in flight together
+        remaining_margin = account_info['margin_available']
+        
+        with ThreadPoolExecutor(max_workers=ORDER_WORKERS) as executor:
+            orders = []
+            for i, signal in enumerate(top_signals):
+                position_size = self.calculate_position_size(account_info['balance'], signal['pair'])
+                margin_needed = estimate_margin(signal['pair'], position_size, signal.get('entry_price', 1.0))
+                
+                if margin_needed > remaining_margin:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("⏸️ Skipping %s: needs ~$%s margin, $%s available", signal['pair'],
+                                    format(margin_needed, ',.2f'), format(remaining_margin, ',.2f'))
+                    continue
+                
+                remaining_margin -= margin_needed
+                if orders:
+                    time.sleep(ORDER_STAGGER_SECONDS)
+                orders.append((i, executor.submit(self.execute_trade, signal, account_info['balance'], position_size)))
             
-            # Small delay between trades
-            time.sleep(2)
+            for i, future in orders:
+                if future.result():
+                    logger.info("✅ Trade %d/%d executed successfully", i + 1, trades_to_execute)
+                else:
+                    logger.error("❌ Trade %d/%d failed", i + 1, trades_to_execute)
         
-        logger.info(f"🎯 Trading session completed. Executed {trades_to_execute} trades")
+        logger.info("🎯 Trading session completed. Executed %d trades", trades_to_execute)
     
     def start_live_trading(self):
         """Start the live trading bot."""
         logger.info("🚀 Starting live trading bot...")
         
-        # Schedule trading sessions
-        schedule.every(30).minutes.do(self.trading_session)  # Every 30 minutes
-        
         logger.info("⏰ Trading sessions scheduled every 30 minutes")
         logger.info("🔄 Bot is now running. Press Ctrl+C to stop.")
         
+        # Sleep straight through to the next session instead of polling
+        next_fire = time.monotonic() + SESSION_INTERVAL_SECONDS
+        
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                time.sleep(max(0, next_fire - time.monotonic()))
+                try:
+                    self.trading_session()
+                finally:
+                    next_fire += SESSION_INTERVAL_SECONDS
                 
         except KeyboardInterrupt:
             logger.info("🛑 Live trading bot stopped by user")
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
 
 def main():
     """Main function to start live trading."""
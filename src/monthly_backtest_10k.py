@@ -10,15 +10,22 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from linear_scaled_backtest import LinearScaledBacktest
 from datetime import datetime
+import numpy as np
+import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+BACKTEST_BALANCE = 10000
+
+# Account sizes shown in the linear-scaling comparison
+SCALING_ACCOUNT_SIZES = np.array([1000, 10000, 50000, 100000])
+
 def run_monthly_backtest():
     """Run a full month backtest with $10,000."""
     try:
         # Initialize with $10,000
-        backtest = LinearScaledBacktest(initial_balance=10000)
+        backtest = LinearScaledBacktest(initial_balance=BACKTEST_BALANCE)
         
         pairs = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD', 'NZD/USD']
         
@@ -131,19 +138,20 @@ def generate_monthly_report(results):
     # Pair performance
     if 'pair_performance' in results:
         print(f"💱 Top Performing Pairs:")
-        pair_performance = results['pair_performance']
-        sorted_pairs = sorted(pair_performance.items(), key=lambda x: x[1]['profit'], reverse=True)
+        pair_performance_df = results.get('pair_performance_df')
+        if pair_performance_df is None:
+            pair_performance_df = pd.DataFrame.from_dict(results['pair_performance'], orient='index')
         
-        for i, (pair, stats) in enumerate(sorted_pairs[:3]):
-            print(f"   {i+1}. {pair}: ${stats['profit']:,.2f} ({stats['win_rate']:.1%} win rate, {stats['trades']} trades)")
+        for i, stats in enumerate(pair_performance_df.nlargest(3, 'profit').itertuples()):
+            print(f"   {i+1}. {stats.Index}: ${stats.profit:,.2f} ({stats.win_rate:.1%} win rate, {stats.trades} trades)")
         print()
     
     # Scaling demonstration
     print(f"📊 SCALING COMPARISON:")
-    print(f"   $1,000 Account (projected): ${total_profit/10:.2f}")
-    print(f"   $10,000 Account (actual): ${total_profit:.2f}")
-    print(f"   $50,000 Account (projected): ${total_profit*5:,.2f}")
-    print(f"   $100,000 Account (projected): ${total_profit*10:,.2f}")
+    projected = total_profit * SCALING_ACCOUNT_SIZES / BACKTEST_BALANCE
+    for size, profit in zip(SCALING_ACCOUNT_SIZES, projected):
+        kind = 'actual' if size == BACKTEST_BALANCE else 'projected'
+        print(f"   ${size:,} Account ({kind}): ${profit:,.2f}")
 
 def main():
     """Run monthly backtest and generate report."""
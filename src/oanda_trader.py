@@ -5,20 +5,113 @@ Places real trades with risk management and alerts
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import json
 import logging
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import List, Dict, Optional
 import time
 
+if __package__:
+    from ._dataclass_options import FROZEN_DATACLASS_OPTIONS
+else:
+    from _dataclass_options import FROZEN_DATACLASS_OPTIONS
+
+# Fast JSON (optional) - orjson parses response bytes directly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _loads = orjson.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads = json.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None).encode()
+
+# Failures the network methods recover from: transport errors and malformed payloads
+API_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, KeyError, ValueError, TypeError)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keep-alive connection pool shared by every request a trader makes
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+# Only idempotent methods (GET/PUT) are retried - orders are never re-sent
+HTTP_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+
+# Margin rates for 30:1 leverage: ~3.33% for majors, ~5% for minors
+MARGIN_RATES = MappingProxyType({
+    'EUR_USD': 0.0333, 'GBP_USD': 0.0333, 'USD_JPY': 0.0333,
+    'USD_CHF': 0.0333, 'AUD_USD': 0.0333, 'USD_CAD': 0.0333,
+    'NZD_USD': 0.05  # Higher margin for minor pairs (20:1 leverage)
+})
+DEFAULT_MARGIN_RATE = 0.05  # Default 5% (20:1 leverage)
+
+# Pair <-> OANDA instrument name translation tables ("EUR/USD" <-> "EUR_USD")
+_TO_UNDERSCORE = str.maketrans({"/": "_"})
+_TO_SLASH = str.maketrans({"_": "/"})
+
+# Precompiled price formatters - JPY pairs quote 3 decimals, others 5
+PRICE_FMT = MappingProxyType({"JPY": "{:.3f}".format, "DEFAULT": "{:.5f}".format})
+
+# OANDA minimum SL/TP distances in pips - DRAMATICALLY INCREASED for CHF after multiple rejections
+# CHF pairs are proving extremely difficult - using professional trading minimums
+MIN_STOP_DISTANCES = MappingProxyType({
+    "CHF": (80, 120),     # CHF pairs: Increased to 80+/120+ pips (was 50/60, still rejected)
+    "JPY": (40, 70),      # JPY pairs: slightly increased / increased for safety
+    "DEFAULT": (30, 60)   # Standard for EUR/USD, GBP/USD, etc.
+})
+
+def _instrument_meta(instrument: str) -> tuple:
+    """(pip_size, margin_rate, format_price, min_sl_distance, min_tp_distance) for an OANDA instrument."""
+    is_jpy = 'JPY' in instrument
+    min_sl_distance, min_tp_distance = MIN_STOP_DISTANCES[
+        "CHF" if 'CHF' in instrument else "JPY" if is_jpy else "DEFAULT"]
+    return (0.01 if is_jpy else 0.0001,
+            MARGIN_RATES.get(instrument, DEFAULT_MARGIN_RATE),
+            PRICE_FMT["JPY" if is_jpy else "DEFAULT"],
+            min_sl_distance, min_tp_distance)
+
+INSTRUMENT_META = MappingProxyType({instrument: _instrument_meta(instrument) for instrument in MARGIN_RATES})
+
+# Position-close request body (both sides, all units) - serialized once
+CLOSE_ALL_BODY = _dumps({"longUnits": "ALL", "shortUnits": "ALL"})
+
+# Short-lived caches that collapse the repeated reads of one signal evaluation
+SUMMARY_TTL_SECONDS = 1.5
+POSITIONS_TTL_SECONDS = 1.0
+PRICE_TTL_SECONDS = 0.5
+
+# Trade alert body, filled %-style by the logger only when INFO is emitted
+TRADE_ALERT_TEMPLATE = """
+🚨 TRADE EXECUTED 🚨
+
+Pair: %s
+Action: %s
+Entry: %.5f
+Target: %.5f
+Stop Loss: %.5f
+Units: %s
+Confidence: %.1f%%
+Risk: $%.2f
+Order ID: %s
+
+Time: %s
+"""
+
+@dataclass(**FROZEN_DATACLASS_OPTIONS)
 class TradeOrder:
-    """Trade order with risk management."""
+    """Trade order with risk management (immutable, slotted on Python 3.11+)."""
     pair: str
     signal_type: str  # BUY or SELL
     entry_price: float
@@ -27,6 +120,34 @@ class TradeOrder:
     confidence: float
     units: int
     risk_amount: float
+    
+    # Derived in __post_init__
+    instrument: str = field(init=False, repr=False, compare=False)      # EUR/USD -> EUR_USD
+    signed_units: int = field(init=False, repr=False, compare=False)    # positive for buy, negative for sell
+    pip_size: float = field(init=False, repr=False, compare=False)
+    min_sl_distance: int = field(init=False, repr=False, compare=False)
+    min_tp_distance: int = field(init=False, repr=False, compare=False)
+    entry_str: str = field(init=False, repr=False, compare=False)       # prices at the instrument's precision
+    target_str: str = field(init=False, repr=False, compare=False)
+    stop_loss_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Derive the order's OANDA fields once so place_market_order does no per-order setup."""
+        instrument = self.pair.translate(_TO_UNDERSCORE)
+        pip_size, _, format_price, min_sl_distance, min_tp_distance = (
+            INSTRUMENT_META.get(instrument) or _instrument_meta(instrument))
+        
+        # Frozen dataclass - derived fields are set through object.__setattr__
+        for name, value in (
+                ('instrument', instrument),
+                ('signed_units', self.units if self.signal_type == "BUY" else -self.units),
+                ('pip_size', pip_size),
+                ('min_sl_distance', min_sl_distance),
+                ('min_tp_distance', min_tp_distance),
+                ('entry_str', format_price(self.entry_price)),
+                ('target_str', format_price(self.target_price)),
+                ('stop_loss_str', format_price(self.stop_loss))):
+            object.__setattr__(self, name, value)
 
 class OANDATrader:
     """Automated OANDA trading system."""
@@ -46,21 +167,46 @@ class OANDATrader:
             "Content-Type": "application/json"
         }
         
+        # One persistent session - reuses the TLS connection across calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                              max_retries=HTTP_RETRY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # /pricing is polled per pair per cycle - served by a bare urllib3 pool
+        # to skip the requests layer (prepared requests, cookies, hooks)
+        self._pricing_pool = urllib3.HTTPSConnectionPool(
+            self.base_url[len("https://"):], maxsize=POOL_MAXSIZE, block=False,
+            headers=self.headers, retries=HTTP_RETRY)
+        self._pricing_path = f"/v3/accounts/{account_id}/pricing?instruments="
+        
         # Risk management settings
         self.max_risk_per_trade = 0.02  # 2% of account per trade
         self.max_daily_risk = 0.06      # 6% of account per day
         self.min_confidence = 0.25      # Lowered to 25% for testing
         
+        # (monotonic timestamp, value) caches
+        self._summary_cache = (0.0, None)
+        self._positions_cache = (0.0, None, frozenset())
+        self._price_cache = {}
+        
         logger.info(f"OANDA Trader initialized for {environment} environment")
 
+    def close(self):
+        """Release the pooled HTTP connections."""
+        self.session.close()
+        self._pricing_pool.close()
+
     def get_account_balance(self) -> float:
         """Get current account balance."""
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/summary"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 balance = float(data['account']['balance'])
                 logger.info(f"Account balance: ${balance:.2f}")
                 return balance
@@ -68,105 +214,115 @@ class OANDATrader:
                 logger.error(f"Failed to get balance: {response.text}")
                 return 0.0
                 
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Error getting account balance: {e}")
             return 0.0
 
+    def invalidate_account_cache(self):
+        """Force the next account summary, positions and price reads to hit the API."""
+        self._summary_cache = (0.0, None)
+        self._positions_cache = (0.0, None, frozenset())
+        self._price_cache.clear()
+
+    def _store_account_summary(self, payload: Dict) -> Dict:
+        """Build, log and cache the summary dict from a /summary response body."""
+        account = payload['account']
+        
+        summary = {
+            'balance': float(account.get('balance', 0)),
+            'nav': float(account.get('NAV', 0)),
+            'margin_used': float(account.get('marginUsed', 0)),
+            'margin_available': float(account.get('marginAvailable', 0)),
+            'margin_rate': float(account.get('marginRate', 0.02)),  # Default 2%
+            'open_trade_count': int(account.get('openTradeCount', 0)),
+            'open_position_count': int(account.get('openPositionCount', 0)),
+            'unrealized_pl': float(account.get('unrealizedPL', 0)),
+            'currency': account.get('currency', 'USD')
+        }
+        
+        logger.info(f"Account Summary:")
+        logger.info(f"  Balance: ${summary['balance']:.2f}")
+        logger.info(f"  NAV: ${summary['nav']:.2f}")
+        logger.info(f"  Margin Used: ${summary['margin_used']:.2f}")
+        logger.info(f"  Margin Available: ${summary['margin_available']:.2f}")
+        logger.info(f"  Open Trades: {summary['open_trade_count']}")
+        logger.info(f"  Unrealized P&L: ${summary['unrealized_pl']:.2f}")
+        
+        self._summary_cache = (time.monotonic(), summary)
+        return summary
+
     def get_account_summary(self) -> Dict:
         """Get comprehensive account summary including margin information."""
+        fetched_at, cached_summary = self._summary_cache
+        if cached_summary is not None and time.monotonic() - fetched_at < SUMMARY_TTL_SECONDS:
+            return cached_summary
+        
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/summary"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             
             if response.status_code == 200:
-                data = response.json()
-                account = data['account']
-                
-                summary = {
-                    'balance': float(account.get('balance', 0)),
-                    'nav': float(account.get('NAV', 0)),
-                    'margin_used': float(account.get('marginUsed', 0)),
-                    'margin_available': float(account.get('marginAvailable', 0)),
-                    'margin_rate': float(account.get('marginRate', 0.02)),  # Default 2%
-                    'open_trade_count': int(account.get('openTradeCount', 0)),
-                    'open_position_count': int(account.get('openPositionCount', 0)),
-                    'unrealized_pl': float(account.get('unrealizedPL', 0)),
-                    'currency': account.get('currency', 'USD')
-                }
-                
-                logger.info(f"Account Summary:")
-                logger.info(f"  Balance: ${summary['balance']:.2f}")
-                logger.info(f"  NAV: ${summary['nav']:.2f}")
-                logger.info(f"  Margin Used: ${summary['margin_used']:.2f}")
-                logger.info(f"  Margin Available: ${summary['margin_available']:.2f}")
-                logger.info(f"  Open Trades: {summary['open_trade_count']}")
-                logger.info(f"  Unrealized P&L: ${summary['unrealized_pl']:.2f}")
-                
-                return summary
+                return self._store_account_summary(_loads(response.content))
             else:
                 logger.error(f"Failed to get account summary: {response.text}")
                 return {}
                 
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Error getting account summary: {e}")
             return {}
 
-    def calculate_margin_required(self, pair: str, units: int) -> float:
-        """Calculate margin required for a trade."""
+    @staticmethod
+    def _compute_margin(instrument: str, units: int, current_price: float) -> float:
+        """Margin for a position at a known price - linear in units."""
+        # For forex: Margin = (Units × Price) × Margin Rate
+        _, margin_rate, *_ = INSTRUMENT_META.get(instrument) or _instrument_meta(instrument)
+        
+        # Fixed margin calculation logic
+        base_currency = instrument.split('_')[0]
+        
+        if base_currency == 'USD':  # USD is base currency (USD/JPY, USD/CHF, USD/CAD)
+            # Margin = units * margin_rate (since units are in USD)
+            return abs(units) * margin_rate
+        # USD is quote currency (EUR/USD, GBP/USD, AUD/USD, NZD/USD)
+        # Margin = (units * price) * margin_rate (convert to USD first)
+        return abs(units) * current_price * margin_rate
+
+    def calculate_margin_required(self, pair: str, units: int, current_price: Optional[float] = None) -> float:
+        """Calculate margin required for a trade (fetches the price unless given)."""
         try:
-            # Get current price for the pair
-            instrument = pair.replace('/', '_')
-            url = f"{self.base_url}/v3/accounts/{self.account_id}/pricing"
-            params = {"instruments": instrument}
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('prices'):
-                    price_info = data['prices'][0]
-                    current_price = (float(price_info['bids'][0]['price']) + 
-                                   float(price_info['asks'][0]['price'])) / 2
-                    
-                    # Calculate margin required
-                    # For forex: Margin = (Units × Price) × Margin Rate
-                    # Typical margin rates for 30:1 leverage: ~3.33% for majors, ~5% for minors
-                    margin_rates = {
-                        'EUR_USD': 0.0333, 'GBP_USD': 0.0333, 'USD_JPY': 0.0333,
-                        'USD_CHF': 0.0333, 'AUD_USD': 0.0333, 'USD_CAD': 0.0333,
-                        'NZD_USD': 0.05  # Higher margin for minor pairs (20:1 leverage)
-                    }
-                    
-                    margin_rate = margin_rates.get(instrument, 0.05)  # Default 5% (20:1 leverage)
-                    
-                    # Fixed margin calculation logic
-                    base_currency = instrument.split('_')[0]
-                    
-                    if base_currency == 'USD':  # USD is base currency (USD/JPY, USD/CHF, USD/CAD)
-                        # Margin = units * margin_rate (since units are in USD)
-                        margin_required = abs(units) * margin_rate
-                    else:  # USD is quote currency (EUR/USD, GBP/USD, AUD/USD, NZD/USD)
-                        # Margin = (units * price) * margin_rate (convert to USD first)
-                        margin_required = abs(units) * current_price * margin_rate
-                    
-                    logger.info(f"Margin required for {abs(units)} units of {pair}: ${margin_required:.2f}")
-                    return margin_required
-                    
-            logger.warning(f"Could not get price for {pair}, using conservative estimate")
+            instrument = pair.translate(_TO_UNDERSCORE)
+            if current_price is None:
+                # Get current price for the pair
+                current_price = self._get_mid_price(instrument)
+            
+            if current_price is not None:
+                margin_required = self._compute_margin(instrument, units, current_price)
+                logger.info("Margin required for %s units of %s: $%.2f", abs(units), pair, margin_required)
+                return margin_required
+                
+            logger.warning("Could not get price for %s, using conservative estimate", pair)
             return abs(units) * 0.05  # Conservative 5% margin estimate
             
-        except Exception as e:
-            logger.error(f"Error calculating margin for {pair}: {e}")
+        except API_ERRORS as e:
+            logger.error("Error calculating margin for %s: %s", pair, e)
             return abs(units) * 0.05  # Conservative fallback
 
-    def check_margin_availability(self, pair: str, units: int) -> Dict:
-        """Check if sufficient margin is available for a trade."""
-        account_summary = self.get_account_summary()
+    def check_margin_availability(self, pair: str, units: int, account_summary: Optional[Dict] = None,
+                                  prices: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        Check if sufficient margin is available for a trade.
+        
+        prices is an optional {instrument: mid} snapshot (see get_prices) used
+        instead of a fresh price read for the margin estimate.
+        """
+        if account_summary is None:
+            account_summary = self.get_account_summary()
         
         if not account_summary:
             return {'available': False, 'reason': 'Cannot get account information'}
         
-        margin_required = self.calculate_margin_required(pair, units)
+        current_price = prices.get(pair.translate(_TO_UNDERSCORE)) if prices else None
+        margin_required = self.calculate_margin_required(pair, units, current_price)
         margin_available = account_summary['margin_available']
         
         # Add safety buffer (keep at least $50 or 5% of balance as buffer)
@@ -190,26 +346,25 @@ class OANDATrader:
             else:
                 result['reason'] = f"Safety buffer protection: need ${margin_required:.2f}, available after buffer ${effective_margin_available:.2f}"
         
-        logger.info(f"Margin Check for {pair}:")
-        logger.info(f"  Required: ${margin_required:.2f}")
-        logger.info(f"  Available: ${margin_available:.2f}")
-        logger.info(f"  After Buffer: ${effective_margin_available:.2f}")
-        logger.info(f"  Status: {'✅ APPROVED' if result['available'] else '❌ REJECTED'}")
+        logger.info("Margin Check for %s:", pair)
+        logger.info("  Required: $%.2f", margin_required)
+        logger.info("  Available: $%.2f", margin_available)
+        logger.info("  After Buffer: $%.2f", effective_margin_available)
+        logger.info("  Status: %s", '✅ APPROVED' if result['available'] else '❌ REJECTED')
         if result['reason']:
-            logger.info(f"  Reason: {result['reason']}")
+            logger.info("  Reason: %s", result['reason'])
         
         return result
 
-    def calculate_safe_position_size(self, signal, account_summary: Dict) -> int:
+    def calculate_safe_position_size(self, signal, account_summary: Dict,
+                                     prices: Optional[Dict[str, float]] = None) -> int:
         """Calculate safe position size considering margin requirements."""
         # Start with risk-based calculation
         risk_amount = account_summary['balance'] * self.max_risk_per_trade
         
         # Calculate pip value and distance to stop loss
-        if isinstance(signal.pair, str) and 'JPY' in signal.pair:
-            pip_value = 0.01
-        else:
-            pip_value = 0.0001
+        instrument = signal.pair.translate(_TO_UNDERSCORE) if isinstance(signal.pair, str) else ''
+        pip_value, *_ = INSTRUMENT_META.get(instrument) or _instrument_meta(instrument)
         
         # Distance from entry to stop loss in pips
         if signal.signal_type == "BUY":
@@ -234,28 +389,28 @@ class OANDATrader:
         risk_based_units = max(min_units, min(base_units, max_units))
         
         # Log calculation details for debugging
-        logger.info(f"📊 Position size calculation for {signal.pair}:")
-        logger.info(f"   Risk amount: ${risk_amount:.2f}")
-        logger.info(f"   Stop distance: {stop_distance:.1f} pips")
-        logger.info(f"   Pip value per 1000 units: ${pip_value_per_1000_units:.2f}")
-        logger.info(f"   Calculated units: {base_units:,}")
-        logger.info(f"   Final units (after limits): {risk_based_units:,}")
+        logger.info("📊 Position size calculation for %s:", signal.pair)
+        logger.info("   Risk amount: $%.2f", risk_amount)
+        logger.info("   Stop distance: %.1f pips", stop_distance)
+        logger.info("   Pip value per 1000 units: $%.2f", pip_value_per_1000_units)
+        logger.info("   Calculated units: %d", base_units)
+        logger.info("   Final units (after limits): %d", risk_based_units)
         
-        # Now check margin constraints
-        margin_check = self.check_margin_availability(signal.pair, risk_based_units)
+        # Now check margin constraints (against the summary we were given)
+        margin_check = self.check_margin_availability(signal.pair, risk_based_units, account_summary, prices)
         
         if margin_check['available']:
-            logger.info(f"Risk-based position size approved: {risk_based_units} units")
+            logger.info("Risk-based position size approved: %s units", risk_based_units)
             return risk_based_units
         
         # If risk-based size doesn't fit, calculate maximum safe size
         effective_margin = margin_check['effective_available']
         
-        # Estimate units that would fit in available margin
-        # This is approximate - we'll verify with actual margin calculation
-        if margin_check['margin_required'] > 0:
-            estimated_margin_per_unit = margin_check['margin_required'] / risk_based_units
-            safe_units = int(effective_margin / estimated_margin_per_unit)
+        # Margin is linear in units, so the per-unit margin of the first check
+        # sizes (and verifies) the reduced position without another request
+        margin_per_unit = margin_check['margin_required'] / risk_based_units
+        if margin_per_unit > 0:
+            safe_units = int(effective_margin / margin_per_unit)
         else:
             safe_units = min_units
         
@@ -263,72 +418,75 @@ class OANDATrader:
         safe_units = max(min_units, min(safe_units, max_units))
         
         # Final verification
-        final_check = self.check_margin_availability(signal.pair, safe_units)
-        
-        if final_check['available']:
-            logger.info(f"Margin-adjusted position size: {safe_units} units (reduced from {risk_based_units})")
+        if safe_units * margin_per_unit <= effective_margin:
+            logger.info("Margin-adjusted position size: %s units (reduced from %s)", safe_units, risk_based_units)
             return safe_units
         else:
-            logger.warning(f"Cannot find safe position size for {signal.pair}")
+            logger.warning("Cannot find safe position size for %s", signal.pair)
             return 0  # Cannot trade safely
 
-    def should_trade_signal(self, signal, manual_override=False) -> bool:
+    def should_trade_signal(self, signal, manual_override=False, prices: Optional[Dict[str, float]] = None) -> bool:
         """Enhanced signal validation with margin checks."""
         
+        # Check confidence threshold first - the only check needing no API data (skip if manual override)
+        if not manual_override and signal.confidence < self.min_confidence:
+            logger.info(f"❌ Signal confidence {signal.confidence:.1%} below minimum {self.min_confidence:.1%}")
+            return False
+        
         if manual_override:
             logger.info(f"🔓 MANUAL OVERRIDE ACTIVATED - Bypassing confidence checks")
             logger.info(f"   Signal: {signal.pair} {signal.signal_type}")
             logger.info(f"   Confidence: {signal.confidence:.1%} (normally requires {self.min_confidence:.1%})")
         
-        # Check confidence threshold (skip if manual override)
-        if not manual_override and signal.confidence < self.min_confidence:
-            logger.info(f"❌ Signal confidence {signal.confidence:.1%} below minimum {self.min_confidence:.1%}")
-            return False
-        
         # Get account summary
         account_summary = self.get_account_summary()
         if not account_summary:
             logger.error("❌ Cannot get account information")
             return False
         
+        # Checks against the summary alone, before any further request
         # Check if account has sufficient balance
         if account_summary['balance'] <= 100:  # Minimum $100 balance
             logger.info(f"❌ Account balance too low: ${account_summary['balance']:.2f}")
             return False
         
+        # Check total margin utilization
+        margin_utilization = account_summary['margin_used'] / account_summary['balance'] if account_summary['balance'] > 0 else 1
+        if margin_utilization > 0.8:  # Don't use more than 80% of balance as margin
+            logger.info(f"❌ Margin utilization too high: {margin_utilization:.1%}")
+            return False
+        
         # Check if we already have a position in this pair
-        open_positions = self.get_open_positions()
-        for position in open_positions:
-            if position['instrument'].replace('_', '/') == signal.pair:
-                logger.info(f"❌ Already have position in {signal.pair}")
-                return False
+        open_positions, open_pairs = self.get_positions_snapshot()
+        if signal.pair in open_pairs:
+            logger.info(f"❌ Already have position in {signal.pair}")
+            return False
         
         # Check daily risk limits
         if len(open_positions) >= 8:  # Increased from 3 to 8 concurrent positions
             logger.info(f"❌ Maximum concurrent positions reached ({len(open_positions)}/8)")
             return False
         
-        # Check if margin is available for minimum trade size
-        margin_check = self.check_margin_availability(signal.pair, 1000)  # Check minimum size
+        # Check if margin is available for minimum trade size (only the price is fetched here)
+        margin_check = self.check_margin_availability(signal.pair, 1000, account_summary, prices)  # Check minimum size
         if not margin_check['available']:
             logger.info(f"❌ Insufficient margin for {signal.pair}: {margin_check['reason']}")
             return False
         
-        # Check total margin utilization
-        margin_utilization = account_summary['margin_used'] / account_summary['balance'] if account_summary['balance'] > 0 else 1
-        if margin_utilization > 0.8:  # Don't use more than 80% of balance as margin
-            logger.info(f"❌ Margin utilization too high: {margin_utilization:.1%}")
-            return False
-        
         if manual_override:
             logger.info(f"✅ Manual override signal approved: {signal.pair} {signal.signal_type}")
         else:
             logger.info(f"✅ Signal approved for trading: {signal.pair} {signal.signal_type}")
         return True
 
-    def execute_signal(self, signal, manual_override=False) -> Optional[str]:
-        """Execute a trading signal with enhanced margin management."""
-        if not self.should_trade_signal(signal, manual_override=manual_override):
+    def execute_signal(self, signal, manual_override=False, prices: Optional[Dict[str, float]] = None) -> Optional[str]:
+        """
+        Execute a trading signal with enhanced margin management.
+        
+        Pass one get_prices snapshot as prices when executing a batch of
+        signals so the margin checks don't each re-read the pricing endpoint.
+        """
+        if not self.should_trade_signal(signal, manual_override=manual_override, prices=prices):
             return None
         
         # Get account summary
@@ -338,14 +496,14 @@ class OANDATrader:
             return None
         
         # Calculate safe position size
-        units = self.calculate_safe_position_size(signal, account_summary)
+        units = self.calculate_safe_position_size(signal, account_summary, prices)
         
         if units <= 0:
             logger.error("❌ Cannot calculate safe position size")
             return None
         
         # Final margin check before placing order
-        final_margin_check = self.check_margin_availability(signal.pair, units)
+        final_margin_check = self.check_margin_availability(signal.pair, units, prices=prices)
         if not final_margin_check['available']:
             logger.error(f"❌ Final margin check failed: {final_margin_check['reason']}")
             return None
@@ -391,21 +549,18 @@ class OANDATrader:
             # VERSION: v2.1 - Added market price validation
             logger.info("📌 OandaTrader Version: v2.1 - Market price validation enabled")
             
-            # Convert pair format (EUR/USD -> EUR_USD)
-            instrument = trade_order.pair.replace('/', '_')
+            instrument = trade_order.instrument
+            pip_size = trade_order.pip_size
+            min_sl_distance = trade_order.min_sl_distance
+            min_tp_distance = trade_order.min_tp_distance
             
             # Get current market prices to validate order levels
             current_prices = self.get_bid_ask_prices(instrument)
             if not current_prices:
-                logger.error(f"❌ Cannot get current market prices for {instrument}")
+                logger.error("❌ Cannot get current market prices for %s", instrument)
                 return None
             
-            # Determine units (positive for buy, negative for sell)
-            units = trade_order.units if trade_order.signal_type == "BUY" else -trade_order.units
-            
-            # Validate and adjust levels based on current market prices
-            pip_size = 0.01 if 'JPY' in instrument else 0.0001
-            
+            # Validate levels against current market prices
             # For BUY orders: use ASK price (we buy at ask)
             # For SELL orders: use BID price (we sell at bid)
             if trade_order.signal_type == "BUY":
@@ -413,13 +568,13 @@ class OANDATrader:
                 
                 # For BUY: TP must be above current ask, SL must be below current bid
                 if trade_order.target_price <= current_price:
-                    logger.error(f"❌ Take profit {trade_order.target_price:.5f} is below/at current ask {current_price:.5f}")
-                    logger.error(f"   Market has moved against the BUY signal")
+                    logger.error("❌ Take profit %.5f is below/at current ask %.5f", trade_order.target_price, current_price)
+                    logger.error("   Market has moved against the BUY signal")
                     return None
                     
                 if trade_order.stop_loss >= current_prices['bid']:
-                    logger.error(f"❌ Stop loss {trade_order.stop_loss:.5f} is above/at current bid {current_prices['bid']:.5f}")
-                    logger.error(f"   Market has moved against the BUY signal")
+                    logger.error("❌ Stop loss %.5f is above/at current bid %.5f", trade_order.stop_loss, current_prices['bid'])
+                    logger.error("   Market has moved against the BUY signal")
                     return None
                     
             else:  # SELL
@@ -427,13 +582,13 @@ class OANDATrader:
                 
                 # For SELL: TP must be below current bid, SL must be above current ask
                 if trade_order.target_price >= current_price:
-                    logger.error(f"❌ Take profit {trade_order.target_price:.5f} is above/at current bid {current_price:.5f}")
-                    logger.error(f"   Market has moved against the SELL signal")
+                    logger.error("❌ Take profit %.5f is above/at current bid %.5f", trade_order.target_price, current_price)
+                    logger.error("   Market has moved against the SELL signal")
                     return None
                     
                 if trade_order.stop_loss <= current_prices['ask']:
-                    logger.error(f"❌ Stop loss {trade_order.stop_loss:.5f} is below/at current ask {current_prices['ask']:.5f}")
-                    logger.error(f"   Market has moved against the SELL signal")
+                    logger.error("❌ Stop loss %.5f is below/at current ask %.5f", trade_order.stop_loss, current_prices['ask'])
+                    logger.error("   Market has moved against the SELL signal")
                     return None
             
             # Enhanced distance validation before placing order
@@ -444,97 +599,78 @@ class OANDATrader:
                 sl_distance_pips = abs(trade_order.stop_loss - current_price) / pip_size
                 tp_distance_pips = abs(current_price - trade_order.target_price) / pip_size
             
-            # OANDA minimum distances - DRAMATICALLY INCREASED for CHF after multiple rejections
-            # CHF pairs are proving extremely difficult - using professional trading minimums
+            # OANDA minimum distances (see MIN_STOP_DISTANCES)
             if 'CHF' in instrument:
-                min_sl_distance = 80   # CHF pairs: Increased to 80+ pips (was 50, still rejected)
-                min_tp_distance = 120  # CHF pairs: Increased to 120+ pips (was 60, still rejected)
-                logger.warning(f"⚠️ CHF pair detected - using extra-wide minimums: {min_sl_distance} SL, {min_tp_distance} TP")
-            elif 'JPY' in instrument:
-                min_sl_distance = 40   # JPY pairs: slightly increased
-                min_tp_distance = 70   # JPY pairs: increased for safety
-            else:
-                min_sl_distance = 30   # Standard for EUR/USD, GBP/USD, etc.
-                min_tp_distance = 60   # Standard TP distance
+                logger.warning("⚠️ CHF pair detected - using extra-wide minimums: %s SL, %s TP", min_sl_distance, min_tp_distance)
             
             if sl_distance_pips < min_sl_distance:
-                logger.error(f"❌ Stop loss too close: {sl_distance_pips:.1f} pips (need {min_sl_distance}+)")
+                logger.error("❌ Stop loss too close: %.1f pips (need %s+)", sl_distance_pips, min_sl_distance)
                 return None
                 
             if tp_distance_pips < min_tp_distance:
-                logger.error(f"❌ Take profit too close: {tp_distance_pips:.1f} pips (need {min_tp_distance}+)")
+                logger.error("❌ Take profit too close: %.1f pips (need %s+)", tp_distance_pips, min_tp_distance)
                 return None
             
             # Log current market conditions
-            logger.info(f"📊 Current market prices for {instrument}:")
-            logger.info(f"   Bid: {current_prices['bid']:.5f}")
-            logger.info(f"   Ask: {current_prices['ask']:.5f}")
-            logger.info(f"   Spread: {current_prices['spread_pips']:.1f} pips")
-            
-            # Format prices with correct precision for the instrument
-            if isinstance(instrument, str) and 'JPY' in instrument:
-                # JPY pairs use 3 decimal places
-                entry_price = f"{trade_order.entry_price:.3f}"
-                target_price = f"{trade_order.target_price:.3f}"
-                stop_loss = f"{trade_order.stop_loss:.3f}"
-            else:
-                # Other pairs use 5 decimal places
-                entry_price = f"{trade_order.entry_price:.5f}"
-                target_price = f"{trade_order.target_price:.5f}"
-                stop_loss = f"{trade_order.stop_loss:.5f}"
+            logger.info("📊 Current market prices for %s:", instrument)
+            logger.info("   Bid: %.5f", current_prices['bid'])
+            logger.info("   Ask: %.5f", current_prices['ask'])
+            logger.info("   Spread: %.1f pips", current_prices['spread_pips'])
             
             # Log the order details before placing
-            logger.info(f"🔄 Placing order:")
-            logger.info(f"   Instrument: {instrument}")
-            logger.info(f"   Units: {units}")
-            logger.info(f"   Signal Entry: {entry_price}")
-            logger.info(f"   Actual Entry: {current_price:.5f} ({'ASK' if trade_order.signal_type == 'BUY' else 'BID'})")
-            logger.info(f"   Target: {target_price}")
-            logger.info(f"   Stop Loss: {stop_loss}")
-            logger.info(f"   SL Distance: {sl_distance_pips:.1f} pips")
-            logger.info(f"   TP Distance: {tp_distance_pips:.1f} pips")
+            logger.info("🔄 Placing order:")
+            logger.info("   Instrument: %s", instrument)
+            logger.info("   Units: %s", trade_order.signed_units)
+            logger.info("   Signal Entry: %s", trade_order.entry_str)
+            logger.info("   Actual Entry: %.5f (%s)", current_price, 'ASK' if trade_order.signal_type == 'BUY' else 'BID')
+            logger.info("   Target: %s", trade_order.target_str)
+            logger.info("   Stop Loss: %s", trade_order.stop_loss_str)
+            logger.info("   SL Distance: %.1f pips", sl_distance_pips)
+            logger.info("   TP Distance: %.1f pips", tp_distance_pips)
             
             order_data = {
                 "order": {
                     "type": "MARKET",
                     "instrument": instrument,
-                    "units": str(units),
+                    "units": str(trade_order.signed_units),
                     "timeInForce": "FOK",
                     "positionFill": "DEFAULT",
                     "stopLossOnFill": {
-                        "price": stop_loss
+                        "price": trade_order.stop_loss_str
                     },
                     "takeProfitOnFill": {
-                        "price": target_price
+                        "price": trade_order.target_str
                     }
                 }
             }
             
-            # Log the full order data
-            logger.info(f"📋 Order JSON: {json.dumps(order_data, indent=2)}")
+            # Log the full order data (serialized only when DEBUG is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 Order JSON: %s", _dumps(order_data, pretty=True).decode())
             
             url = f"{self.base_url}/v3/accounts/{self.account_id}/orders"
-            response = requests.post(url, headers=self.headers, json=order_data)
+            response = self.session.post(url, data=_dumps(order_data))
             
             # Log the response details
-            logger.info(f"📡 Response Status: {response.status_code}")
-            logger.info(f"📡 Response Headers: {dict(response.headers)}")
-            logger.info(f"📡 Response Body: {response.text}")
+            logger.info("📡 Response Status: %s", response.status_code)
+            logger.info("📡 Response Headers: %s", response.headers)  # CaseInsensitiveDict reprs as a plain dict
+            logger.info("📡 Response Body: %s", response.text)
             
             if response.status_code == 201:
-                result = response.json()
+                result = _loads(response.content)
                 
                 # Check if order was filled successfully
                 if 'orderFillTransaction' in result:
                     order_id = result['orderFillTransaction']['id']
+                    self.invalidate_account_cache()
                     
-                    logger.info(f"✅ Order placed successfully!")
-                    logger.info(f"   Order ID: {order_id}")
-                    logger.info(f"   {trade_order.signal_type} {trade_order.pair}")
-                    logger.info(f"   Units: {units}")
-                    logger.info(f"   Entry: {entry_price}")
-                    logger.info(f"   Target: {target_price}")
-                    logger.info(f"   Stop Loss: {stop_loss}")
+                    logger.info("✅ Order placed successfully!")
+                    logger.info("   Order ID: %s", order_id)
+                    logger.info("   %s %s", trade_order.signal_type, trade_order.pair)
+                    logger.info("   Units: %s", trade_order.signed_units)
+                    logger.info("   Entry: %s", trade_order.entry_str)
+                    logger.info("   Target: %s", trade_order.target_str)
+                    logger.info("   Stop Loss: %s", trade_order.stop_loss_str)
                     
                     return order_id
                 
@@ -543,83 +679,111 @@ class OANDATrader:
                     cancel_reason = result['orderCancelTransaction'].get('reason', 'Unknown')
                     order_id = result['orderCreateTransaction']['id']
                     
-                    logger.error(f"❌ Order was cancelled immediately:")
-                    logger.error(f"   Order ID: {order_id}")
-                    logger.error(f"   Reason: {cancel_reason}")
-                    logger.error(f"   {trade_order.signal_type} {trade_order.pair}")
-                    logger.error(f"   Entry: {entry_price}")
-                    logger.error(f"   Target: {target_price}")
-                    logger.error(f"   Stop Loss: {stop_loss}")
-                    logger.error(f"   SL Distance: {sl_distance_pips:.1f} pips")
-                    logger.error(f"   TP Distance: {tp_distance_pips:.1f} pips")
+                    logger.error("❌ Order was cancelled immediately:")
+                    logger.error("   Order ID: %s", order_id)
+                    logger.error("   Reason: %s", cancel_reason)
+                    logger.error("   %s %s", trade_order.signal_type, trade_order.pair)
+                    logger.error("   Entry: %s", trade_order.entry_str)
+                    logger.error("   Target: %s", trade_order.target_str)
+                    logger.error("   Stop Loss: %s", trade_order.stop_loss_str)
+                    logger.error("   SL Distance: %.1f pips", sl_distance_pips)
+                    logger.error("   TP Distance: %.1f pips", tp_distance_pips)
                     
                     # Handle specific cancellation reasons
                     if cancel_reason == "TAKE_PROFIT_ON_FILL_LOSS":
-                        logger.error(f"   💡 Issue: Take profit/stop loss levels too close to market price")
-                        logger.error(f"   💡 Suggestion: Increase minimum pip distance for TP/SL levels")
-                        logger.error(f"   💡 Try distances: SL ≥ 50 pips, TP ≥ 60 pips for USD/CHF")
+                        logger.error("   💡 Issue: Take profit/stop loss levels too close to market price")
+                        logger.error("   💡 Suggestion: Increase minimum pip distance for TP/SL levels")
+                        logger.error("   💡 Try distances: SL ≥ 50 pips, TP ≥ 60 pips for USD/CHF")
                     
                     return None
                 
                 else:
-                    logger.error(f"❌ Unexpected response format:")
-                    logger.error(f"   Available keys: {list(result.keys())}")
+                    logger.error("❌ Unexpected response format:")
+                    logger.error("   Available keys: %s", list(result.keys()))
                     return None
             else:
-                logger.error(f"❌ Failed to place order:")
-                logger.error(f"   Status Code: {response.status_code}")
-                logger.error(f"   Response: {response.text}")
+                logger.error("❌ Failed to place order:")
+                logger.error("   Status Code: %s", response.status_code)
+                logger.error("   Response: %s", response.text)
                 
                 # Try to parse error details
                 try:
-                    error_data = response.json()
+                    error_data = _loads(response.content)
                     if 'errorMessage' in error_data:
-                        logger.error(f"   Error Message: {error_data['errorMessage']}")
+                        logger.error("   Error Message: %s", error_data['errorMessage'])
                     if 'errorCode' in error_data:
-                        logger.error(f"   Error Code: {error_data['errorCode']}")
-                except:
+                        logger.error("   Error Code: %s", error_data['errorCode'])
+                except ValueError:
                     pass
                 
                 return None
                 
-        except Exception as e:
-            logger.error(f"❌ Exception placing order: {e}")
-            import traceback
-            logger.error(f"   Traceback: {traceback.format_exc()}")
+        except API_ERRORS as e:
+            logger.error("❌ Exception placing order: %s", e)
             return None
 
-    def get_open_positions(self) -> List[Dict]:
-        """Get all open positions."""
+    @staticmethod
+    def _open_positions(payload: Dict) -> List[Dict]:
+        """Positions with non-zero units from an /openPositions response body.
+        
+        OANDA already leaves closed instruments out of /openPositions (unlike
+        /positions, which lists every instrument ever traded); the unit check
+        is kept as a guard.
+        """
+        positions = []
+        
+        for position in payload.get('positions', []):
+            # Only include positions with actual units
+            long_units = float(position['long']['units'])
+            short_units = float(position['short']['units'])
+            
+            if long_units != 0 or short_units != 0:
+                positions.append(position)
+        
+        return positions
+
+    def _store_positions(self, positions: List[Dict]) -> tuple:
+        """Cache a positions snapshot along with the set of pairs it holds."""
+        open_pairs = frozenset(position['instrument'].translate(_TO_SLASH) for position in positions)
+        self._positions_cache = (time.monotonic(), positions, open_pairs)
+        return positions, open_pairs
+
+    def get_positions_snapshot(self, force: bool = False) -> tuple:
+        """
+        (open positions, frozenset of their 'EUR/USD'-style pairs), up to
+        POSITIONS_TTL_SECONDS old unless forced.
+        
+        Both come from the same cache entry, so the pair set always matches
+        the positions even when the shared trader is read from other threads.
+        """
+        fetched_at, positions, open_pairs = self._positions_cache
+        if not force and positions is not None and time.monotonic() - fetched_at < POSITIONS_TTL_SECONDS:
+            return positions, open_pairs
+        
         try:
-            url = f"{self.base_url}/v3/accounts/{self.account_id}/positions"
-            response = requests.get(url, headers=self.headers)
+            url = f"{self.base_url}/v3/accounts/{self.account_id}/openPositions"
+            response = self.session.get(url)
             
             if response.status_code == 200:
-                data = response.json()
-                positions = []
-                
-                for position in data.get('positions', []):
-                    # Only include positions with actual units
-                    long_units = float(position['long']['units'])
-                    short_units = float(position['short']['units'])
-                    
-                    if long_units != 0 or short_units != 0:
-                        positions.append(position)
-                
-                return positions
+                return self._store_positions(self._open_positions(_loads(response.content)))
             else:
                 logger.error(f"Failed to get positions: {response.text}")
-                return []
                 
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Error getting positions: {e}")
-            return []
+        
+        return [], frozenset()
+
+    def get_open_positions(self, force: bool = False) -> List[Dict]:
+        """Get all open positions (a snapshot up to POSITIONS_TTL_SECONDS old unless forced)."""
+        positions, _ = self.get_positions_snapshot(force)
+        return positions
 
     def close_position(self, instrument: str) -> Optional[str]:
         """Close an open position."""
         try:
             # First check if position exists
-            positions = self.get_open_positions()
+            positions = self.get_open_positions(force=True)
             position_exists = False
             
             for pos in positions:
@@ -635,15 +799,10 @@ class OANDATrader:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/positions/{instrument}/close"
             
             # Close both long and short sides
-            close_data = {
-                "longUnits": "ALL",
-                "shortUnits": "ALL"
-            }
-            
-            response = requests.put(url, headers=self.headers, json=close_data)
+            response = self.session.put(url, data=CLOSE_ALL_BODY)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 
                 # Extract order IDs from response
                 order_ids = []
@@ -653,6 +812,7 @@ class OANDATrader:
                     order_ids.append(data['shortOrderFillTransaction']['id'])
                 
                 order_id = ', '.join(order_ids) if order_ids else 'CLOSED'
+                self.invalidate_account_cache()
                 
                 logger.info(f"✅ Successfully closed position for {instrument}")
                 logger.info(f"   Order ID(s): {order_id}")
@@ -662,53 +822,83 @@ class OANDATrader:
                 logger.error(f"Failed to close position for {instrument}: {response.text}")
                 return None
                 
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Error closing position for {instrument}: {e}")
             return None
 
+    @staticmethod
+    def _bid_ask(price_info: Dict) -> tuple:
+        """Top-of-book (bid, ask) from one /pricing entry."""
+        return float(price_info['bids'][0]['price']), float(price_info['asks'][0]['price'])
+
+    @staticmethod
+    def _mid(price_info: Dict) -> float:
+        """Mid price from one /pricing entry."""
+        bid, ask = OANDATrader._bid_ask(price_info)
+        return (bid + ask) * 0.5
+
+    def _store_prices(self, payload: Dict) -> Dict[str, float]:
+        """Mid prices from a /pricing response body, recorded in the price cache."""
+        prices = {}
+        fetched_at = time.monotonic()
+        for price_info in payload.get('prices', []):
+            mid_price = self._mid(price_info)
+            prices[price_info['instrument']] = mid_price
+            self._price_cache[price_info['instrument']] = (fetched_at, mid_price)
+        return prices
+
+    def get_prices(self, instruments: List[str]) -> Dict[str, float]:
+        """Mid prices for several instruments in one /pricing request (refreshes the price cache)."""
+        prices = {}
+        try:
+            response = self._pricing_pool.request("GET", self._pricing_path + ",".join(instruments))
+            
+            if response.status == 200:
+                prices = self._store_prices(_loads(response.data))
+            else:
+                logger.error(f"Failed to get prices for {', '.join(instruments)}: {response.data.decode(errors='replace')}")
+                
+        except API_ERRORS as e:
+            logger.error(f"Error getting prices for {', '.join(instruments)}: {e}")
+        
+        return prices
+
+    def _get_mid_price(self, instrument: str) -> Optional[float]:
+        """Mid price for an instrument, reused for PRICE_TTL_SECONDS."""
+        fetched_at, mid_price = self._price_cache.get(instrument, (0.0, None))
+        if mid_price is not None and time.monotonic() - fetched_at < PRICE_TTL_SECONDS:
+            return mid_price
+        
+        return self.get_prices([instrument]).get(instrument)
+
     def get_current_price(self, instrument: str) -> Optional[float]:
         """Get current market price for an instrument."""
         try:
-            url = f"{self.base_url}/v3/accounts/{self.account_id}/pricing"
-            params = {"instruments": instrument}
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('prices'):
-                    price_info = data['prices'][0]
-                    # Return mid price
-                    bid = float(price_info['bids'][0]['price'])
-                    ask = float(price_info['asks'][0]['price'])
-                    mid_price = (bid + ask) / 2
-                    return mid_price
+            mid_price = self._get_mid_price(instrument)
+            if mid_price is not None:
+                return mid_price
                     
             logger.warning(f"Could not get current price for {instrument}")
             return None
             
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Error getting current price for {instrument}: {e}")
             return None
     
     def get_bid_ask_prices(self, instrument: str) -> Optional[Dict]:
         """Get current bid/ask prices for an instrument."""
         try:
-            url = f"{self.base_url}/v3/accounts/{self.account_id}/pricing"
-            params = {"instruments": instrument}
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('prices'):
-                    price_info = data['prices'][0]
-                    bid = float(price_info['bids'][0]['price'])
-                    ask = float(price_info['asks'][0]['price'])
-                    mid_price = (bid + ask) / 2
+            response = self._pricing_pool.request("GET", self._pricing_path + instrument)
+            
+            if response.status == 200:
+                prices = _loads(response.data).get('prices')
+                if prices:
+                    price_info = prices[0]
+                    bid, ask = self._bid_ask(price_info)
+                    mid_price = (bid + ask) * 0.5
                     
                     # Calculate spread in pips
-                    pip_size = 0.01 if 'JPY' in instrument else 0.0001
+                    pip_size, *_ = INSTRUMENT_META.get(instrument) or _instrument_meta(instrument)
                     spread_pips = (ask - bid) / pip_size
                     
                     return {
@@ -722,29 +912,18 @@ class OANDATrader:
             logger.warning(f"Could not get bid/ask prices for {instrument}")
             return None
             
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Error getting bid/ask prices for {instrument}: {e}")
             return None
 
     def send_trade_alert(self, trade_order: TradeOrder, order_id: str):
         """Send trade alert (placeholder for notifications)."""
-        alert_message = f"""
-🚨 TRADE EXECUTED 🚨
-
-Pair: {trade_order.pair}
-Action: {trade_order.signal_type}
-Entry: {trade_order.entry_price:.5f}
-Target: {trade_order.target_price:.5f}
-Stop Loss: {trade_order.stop_loss:.5f}
-Units: {trade_order.units}
-Confidence: {trade_order.confidence:.1%}
-Risk: ${trade_order.risk_amount:.2f}
-Order ID: {order_id}
-
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        
-        logger.info(alert_message)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(TRADE_ALERT_TEMPLATE,
+                        trade_order.pair, trade_order.signal_type,
+                        trade_order.entry_price, trade_order.target_price, trade_order.stop_loss,
+                        trade_order.units, trade_order.confidence * 100, trade_order.risk_amount,
+                        order_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         # Here you could add email, SMS, or push notifications
 
 def main():
@@ -4,10 +4,6 @@
 Balanced approach: Quality filtering + Opportunity capture
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -16,10 +12,28 @@ import logging
 from typing import Dict, List, Optional
 import json
 
+if __package__:
+    from ._indicators import technical_indicators
+    from ._trade_sim_jit import simulate_trade_path, simulate_trade_paths, TRADE_OUTCOMES, OUTCOME_NO_EXIT
+else:
+    from _indicators import technical_indicators
+    from _trade_sim_jit import simulate_trade_path, simulate_trade_paths, TRADE_OUTCOMES, OUTCOME_NO_EXIT
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Flat per-trade journal (one struct row per recorded trade) used for the
+# result aggregation instead of walking the nested trade-record dicts
+TRADE_JOURNAL_DTYPE = np.dtype([
+    ('pair', 'U7'),
+    ('outcome', 'i1'),
+    ('hold_hours', 'i4'),
+    ('profit', 'f8'),
+    ('pips', 'f8')
+])
+JOURNAL_INITIAL_CAPACITY = 1024
+
 class OptimizedAdvancedBacktest:
     """
     Optimized backtest with balanced quality vs opportunity approach
@@ -43,9 +57,34 @@ class OptimizedAdvancedBacktest:
         self.all_signals = []
         self.filtered_signals = []
         self.rejected_signals = []
+        self.reset_journal()
+        
+        # pair -> (price frame, indicator arrays over its full history)
+        self._indicator_cache = {}
         
         logger.info("🎯 Optimized Advanced Backtest initialized")
     
+    def reset_journal(self):
+        """Start an empty preallocated trade journal."""
+        self._journal = np.empty(JOURNAL_INITIAL_CAPACITY, dtype=TRADE_JOURNAL_DTYPE)
+        self._journal_size = 0
+    
+    def _journal_trade(self, pair: str, trade_result: Dict):
+        """Append one row to the trade journal, doubling its capacity when full."""
+        if self._journal_size == len(self._journal):
+            grown = np.empty(2 * len(self._journal), dtype=TRADE_JOURNAL_DTYPE)
+            grown[:self._journal_size] = self._journal
+            self._journal = grown
+        
+        self._journal[self._journal_size] = (
+            pair,
+            TRADE_OUTCOMES.index(trade_result['outcome']),
+            trade_result['hold_hours'],
+            trade_result['profit_usd'],
+            trade_result['profit_pips']
+        )
+        self._journal_size += 1
+    
     def get_forex_data(self, pair: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """Get forex data from Yahoo Finance."""
         try:
@@ -78,24 +117,35 @@ class OptimizedAdvancedBacktest:
     
     def calculate_enhanced_technical_score(self, data: pd.DataFrame) -> Dict:
         """Calculate enhanced technical analysis with multiple signals."""
+        close = data['Close'].to_numpy()
+        return self.score_indicators(close, technical_indicators(close), len(close) - 1)
+    
+    def indicators_for(self, pair: str, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Indicator arrays over a pair's full history, computed once per frame.
+        
+        Every indicator is causal, so the value at bar i equals the one
+        recomputed from data[:i + 1] - scans only index into these arrays.
+        """
+        cached = self._indicator_cache.get(pair)
+        if cached is None or cached[0] is not data:
+            close = data['Close'].to_numpy()
+            indicators = technical_indicators(close)
+            indicators['close'] = close
+            cached = self._indicator_cache[pair] = (data, indicators)
+        return cached[1]
+    
+    def score_indicators(self, close: np.ndarray, indicators: Dict[str, np.ndarray], idx: int) -> Dict:
+        """Technical score at bar idx from precomputed indicator arrays."""
         try:
-            if len(data) < 50:
+            if idx < 49:  # Need 50 bars of history
                 return {'score': 0.0, 'signals': [], 'strength': 'weak'}
             
-            close = data['Close']
-            high = data['High']
-            low = data['Low']
-            
             signals = []
             total_score = 0.0
             
             # 1. RSI Analysis (More sensitive)
-            delta = close.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1]
+            current_rsi = indicators['rsi'][idx]
             
             if current_rsi < 35:  # Oversold (relaxed from 30)
                 total_score += 0.25
@@ -105,64 +155,50 @@ class OptimizedAdvancedBacktest:
                 signals.append("RSI Overbought")
             
             # 2. Moving Average Confluence
-            ma_10 = close.rolling(window=10).mean()
-            ma_20 = close.rolling(window=20).mean()
-            ma_50 = close.rolling(window=50).mean()
-            current_price = close.iloc[-1]
+            ma_10 = indicators['ma_10'][idx]
+            ma_20 = indicators['ma_20'][idx]
+            ma_50 = indicators['ma_50'][idx]
+            current_price = close[idx]
             
             # Multiple MA alignment
-            if current_price > ma_10.iloc[-1] > ma_20.iloc[-1] > ma_50.iloc[-1]:
+            if current_price > ma_10 > ma_20 > ma_50:
                 total_score += 0.35
                 signals.append("Strong Bullish MA")
-            elif current_price < ma_10.iloc[-1] < ma_20.iloc[-1] < ma_50.iloc[-1]:
+            elif current_price < ma_10 < ma_20 < ma_50:
                 total_score -= 0.35
                 signals.append("Strong Bearish MA")
-            elif current_price > ma_20.iloc[-1] > ma_50.iloc[-1]:
+            elif current_price > ma_20 > ma_50:
                 total_score += 0.2
                 signals.append("Bullish MA")
-            elif current_price < ma_20.iloc[-1] < ma_50.iloc[-1]:
+            elif current_price < ma_20 < ma_50:
                 total_score -= 0.2
                 signals.append("Bearish MA")
             
-            # 3. MACD with Signal Line
-            exp1 = close.ewm(span=12).mean()
-            exp2 = close.ewm(span=26).mean()
-            macd = exp1 - exp2
-            signal_line = macd.ewm(span=9).mean()
-            macd_histogram = macd - signal_line
-            
-            # MACD crossovers and momentum
-            if len(macd_histogram) >= 2:
-                if macd_histogram.iloc[-1] > 0 and macd_histogram.iloc[-2] <= 0:
-                    total_score += 0.3
-                    signals.append("MACD Bullish Cross")
-                elif macd_histogram.iloc[-1] < 0 and macd_histogram.iloc[-2] >= 0:
-                    total_score -= 0.3
-                    signals.append("MACD Bearish Cross")
-                elif macd_histogram.iloc[-1] > 0:
-                    total_score += 0.1
-                    signals.append("MACD Bullish")
-                elif macd_histogram.iloc[-1] < 0:
-                    total_score -= 0.1
-                    signals.append("MACD Bearish")
+            # 3. MACD crossovers and momentum
+            macd_now, macd_prev = indicators['macd_hist'][idx], indicators['macd_hist'][idx - 1]
+            if macd_now > 0 and macd_prev <= 0:
+                total_score += 0.3
+                signals.append("MACD Bullish Cross")
+            elif macd_now < 0 and macd_prev >= 0:
+                total_score -= 0.3
+                signals.append("MACD Bearish Cross")
+            elif macd_now > 0:
+                total_score += 0.1
+                signals.append("MACD Bullish")
+            elif macd_now < 0:
+                total_score -= 0.1
+                signals.append("MACD Bearish")
             
             # 4. Bollinger Bands
-            bb_period = 20
-            bb_std = 2
-            bb_middle = close.rolling(window=bb_period).mean()
-            bb_std_dev = close.rolling(window=bb_period).std()
-            bb_upper = bb_middle + (bb_std_dev * bb_std)
-            bb_lower = bb_middle - (bb_std_dev * bb_std)
-            
-            if current_price <= bb_lower.iloc[-1]:
+            if current_price <= indicators['bb_lower'][idx]:
                 total_score += 0.2
                 signals.append("BB Oversold")
-            elif current_price >= bb_upper.iloc[-1]:
+            elif current_price >= indicators['bb_upper'][idx]:
                 total_score -= 0.2
                 signals.append("BB Overbought")
             
             # 5. Price momentum
-            price_change_5 = (current_price - close.iloc[-6]) / close.iloc[-6] * 100
+            price_change_5 = (current_price - close[idx - 5]) / close[idx - 5] * 100
             if abs(price_change_5) > 0.5:  # Significant momentum
                 if price_change_5 > 0:
                     total_score += 0.15
@@ -187,7 +223,7 @@ class OptimizedAdvancedBacktest:
                 'signals': signals,
                 'strength': strength,
                 'rsi': current_rsi,
-                'price_vs_ma20': (current_price - ma_20.iloc[-1]) / ma_20.iloc[-1] * 100
+                'price_vs_ma20': (current_price - ma_20) / ma_20 * 100
             }
             
         except Exception as e:
@@ -446,172 +482,90 @@ class OptimizedAdvancedBacktest:
     def simulate_optimized_trade(self, signal: Dict, position_info: Dict, future_data: pd.DataFrame) -> Dict:
         """Simulate trade with optimized exit strategy."""
         try:
-            entry_price = signal['entry_price']
-            target_price = signal['target_price']
-            stop_loss = signal['stop_loss']
-            units = position_info['units']
-            
-            # Track trade progress
-            highest_favorable = entry_price
-            current_stop = stop_loss
-            partial_profits_taken = 0
-            
-            for i, (timestamp, row) in enumerate(future_data.iterrows()):
-                current_price = row['Close']
-                
-                # Update highest favorable
-                if signal['signal_type'] == "BUY":
-                    if current_price > highest_favorable:
-                        highest_favorable = current_price
-                else:
-                    if current_price < highest_favorable:
-                        highest_favorable = current_price
-                
-                # Enhanced trailing stop logic
-                if signal['signal_type'] == "BUY":
-                    progress = (highest_favorable - entry_price) / (target_price - entry_price)
-                    
-                    # Partial profit taking
-                    if progress > 0.6 and partial_profits_taken == 0:
-                        # Take 30% profit at 60% to target
-                        partial_profits_taken = 0.3
-                        # Move stop to breakeven
-                        current_stop = max(current_stop, entry_price)
-                    elif progress > 0.4:
-                        # Trailing stop at 40% progress
-                        trail_distance = (highest_favorable - entry_price) * 0.4
-                        new_stop = highest_favorable - trail_distance
-                        current_stop = max(current_stop, new_stop)
-                    elif progress > 0.25:
-                        # Conservative trailing at 25% progress
-                        trail_distance = (highest_favorable - entry_price) * 0.6
-                        new_stop = highest_favorable - trail_distance
-                        current_stop = max(current_stop, new_stop)
-                        
-                else:  # SELL
-                    progress = (entry_price - highest_favorable) / (entry_price - target_price)
-                    
-                    if progress > 0.6 and partial_profits_taken == 0:
-                        partial_profits_taken = 0.3
-                        current_stop = min(current_stop, entry_price)
-                    elif progress > 0.4:
-                        trail_distance = (entry_price - highest_favorable) * 0.4
-                        new_stop = highest_favorable + trail_distance
-                        current_stop = min(current_stop, new_stop)
-                    elif progress > 0.25:
-                        trail_distance = (entry_price - highest_favorable) * 0.6
-                        new_stop = highest_favorable + trail_distance
-                        current_stop = min(current_stop, new_stop)
-                
-                # Check exit conditions
-                if signal['signal_type'] == "BUY":
-                    if current_price <= current_stop:
-                        # Stop loss hit
-                        profit_pips = (current_stop - entry_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                        profit_usd = profit_pips * 0.10 * (units / 1000) * (1 - partial_profits_taken)
-                        
-                        # Add partial profits if any
-                        if partial_profits_taken > 0:
-                            partial_pips = (highest_favorable - entry_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                            profit_usd += partial_pips * 0.10 * (units / 1000) * partial_profits_taken
-                        
-                        return {
-                            'outcome': 'STOP_LOSS',
-                            'exit_price': current_stop,
-                            'profit_pips': profit_pips,
-                            'profit_usd': profit_usd,
-                            'hold_hours': i + 1,
-                            'partial_profits': partial_profits_taken
-                        }
-                        
-                    elif current_price >= target_price:
-                        # Target hit
-                        profit_pips = (target_price - entry_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                        profit_usd = profit_pips * 0.10 * (units / 1000)
-                        
-                        return {
-                            'outcome': 'TARGET_HIT',
-                            'exit_price': target_price,
-                            'profit_pips': profit_pips,
-                            'profit_usd': profit_usd,
-                            'hold_hours': i + 1,
-                            'partial_profits': partial_profits_taken
-                        }
-                        
-                else:  # SELL
-                    if current_price >= current_stop:
-                        profit_pips = (entry_price - current_stop) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                        profit_usd = profit_pips * 0.10 * (units / 1000) * (1 - partial_profits_taken)
-                        
-                        if partial_profits_taken > 0:
-                            partial_pips = (entry_price - highest_favorable) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                            profit_usd += partial_pips * 0.10 * (units / 1000) * partial_profits_taken
-                        
-                        return {
-                            'outcome': 'STOP_LOSS',
-                            'exit_price': current_stop,
-                            'profit_pips': profit_pips,
-                            'profit_usd': profit_usd,
-                            'hold_hours': i + 1,
-                            'partial_profits': partial_profits_taken
-                        }
-                        
-                    elif current_price <= target_price:
-                        profit_pips = (entry_price - target_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                        profit_usd = profit_pips * 0.10 * (units / 1000)
-                        
-                        return {
-                            'outcome': 'TARGET_HIT',
-                            'exit_price': target_price,
-                            'profit_pips': profit_pips,
-                            'profit_usd': profit_usd,
-                            'hold_hours': i + 1,
-                            'partial_profits': partial_profits_taken
-                        }
-                
-                # Timeout after 72 hours (extended)
-                if i >= 72:
-                    if signal['signal_type'] == "BUY":
-                        profit_pips = (current_price - entry_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                    else:
-                        profit_pips = (entry_price - current_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                    
-                    profit_usd = profit_pips * 0.10 * (units / 1000) * (1 - partial_profits_taken)
-                    
-                    if partial_profits_taken > 0:
-                        if signal['signal_type'] == "BUY":
-                            partial_pips = (highest_favorable - entry_price) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                        else:
-                            partial_pips = (entry_price - highest_favorable) / (0.01 if 'JPY' in signal['pair'] else 0.0001)
-                        profit_usd += partial_pips * 0.10 * (units / 1000) * partial_profits_taken
-                    
-                    return {
-                        'outcome': 'TIMEOUT',
-                        'exit_price': current_price,
-                        'profit_pips': profit_pips,
-                        'profit_usd': profit_usd,
-                        'hold_hours': 72,
-                        'partial_profits': partial_profits_taken
-                    }
+            pip_size = 0.01 if 'JPY' in signal['pair'] else 0.0001
             
-            return {'outcome': 'NO_EXIT', 'reason': 'End of data'}
+            # Per-bar loop runs in the (optionally) compiled kernel
+            outcome, exit_price, profit_pips, profit_usd, hold_hours, partial_profits_taken = simulate_trade_path(
+                self._bar_array(future_data['Close']),
+                float(signal['entry_price']), float(signal['target_price']), float(signal['stop_loss']),
+                signal['signal_type'] == "BUY", pip_size, float(position_info['units'])
+            )
+            
+            return self._trade_result(outcome, exit_price, profit_pips, profit_usd, hold_hours, partial_profits_taken)
             
         except Exception as e:
             logger.error(f"Error simulating trade: {e}")
             return {'outcome': 'ERROR', 'reason': str(e)}
     
+    @staticmethod
+    def _bar_array(series: pd.Series) -> np.ndarray:
+        """Contiguous bar buffer for the kernels - float32 bars are kept as float32."""
+        dtype = np.float32 if series.dtype == np.float32 else np.float64
+        return np.ascontiguousarray(series.to_numpy(dtype=dtype))
+    
+    @staticmethod
+    def _trade_result(outcome, exit_price, profit_pips, profit_usd, hold_hours, partial_profits_taken) -> Dict:
+        """Translate a kernel result back into a trade result dict."""
+        if outcome == OUTCOME_NO_EXIT:
+            return {'outcome': 'NO_EXIT', 'reason': 'End of data'}
+        
+        return {
+            'outcome': TRADE_OUTCOMES[outcome],
+            'exit_price': float(exit_price),
+            'profit_pips': float(profit_pips),
+            'profit_usd': float(profit_usd),
+            'hold_hours': int(hold_hours),
+            'partial_profits': float(partial_profits_taken)
+        }
+    
+    def simulate_optimized_trades(self, signals: List[Dict], position_infos: List[Dict],
+                                  future_frames: List[pd.DataFrame]) -> List[Dict]:
+        """Simulate a batch of independent trades in one (parallel) kernel call."""
+        n_trades = len(signals)
+        lengths = np.array([len(frame) for frame in future_frames], dtype=np.int64)
+        
+        bar_dtype = np.float32 if all(frame['Close'].dtype == np.float32 for frame in future_frames) else np.float64
+        closes = np.zeros((n_trades, int(lengths.max()) if n_trades else 0), dtype=bar_dtype)
+        for k, frame in enumerate(future_frames):
+            closes[k, :lengths[k]] = frame['Close'].to_numpy()
+        
+        batch = simulate_trade_paths(
+            closes, lengths,
+            np.array([s['entry_price'] for s in signals], dtype=np.float64),
+            np.array([s['target_price'] for s in signals], dtype=np.float64),
+            np.array([s['stop_loss'] for s in signals], dtype=np.float64),
+            np.array([s['signal_type'] == "BUY" for s in signals], dtype=np.bool_),
+            np.array([0.01 if 'JPY' in s['pair'] else 0.0001 for s in signals], dtype=np.float64),
+            np.array([p['units'] for p in position_infos], dtype=np.float64)
+        )
+        
+        return [self._trade_result(*row) for row in zip(*batch)]
+    
+    def load_data(self, pairs: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """Get data for all pairs (reusable across runs over the same window)."""
+        pair_data = {}
+        for pair in pairs:
+            data = self.get_forex_data(pair, start_date, end_date)
+            if not data.empty:
+                pair_data[pair] = data
+        return pair_data
+    
     def run_optimized_backtest(self, pairs: List[str], start_date: datetime, end_date: datetime) -> Dict:
         """Run the optimized backtest."""
+        logger.info(f"🎯 Starting optimized backtest: {start_date} to {end_date}")
+        
+        try:
+            pair_data = self.load_data(pairs, start_date, end_date)
+        except Exception as e:
+            logger.error(f"Error running backtest: {e}")
+            return {'error': str(e)}
+        
+        return self.run_on_data(pair_data, pairs, start_date, end_date)
+    
+    def run_on_data(self, pair_data: Dict[str, pd.DataFrame], pairs: List[str],
+                    start_date: datetime, end_date: datetime) -> Dict:
+        """Run the optimized backtest over already loaded pair data."""
         try:
-            logger.info(f"🎯 Starting optimized backtest: {start_date} to {end_date}")
-            
-            # Get data for all pairs
-            pair_data = {}
-            for pair in pairs:
-                data = self.get_forex_data(pair, start_date, end_date)
-                if not data.empty:
-                    pair_data[pair] = data
-            
             if not pair_data:
                 return {'error': 'No data retrieved'}
             
@@ -632,16 +586,17 @@ class OptimizedAdvancedBacktest:
                     
                     try:
                         data = pair_data[pair]
+                        indicators = self.indicators_for(pair, data)
                         
-                        # Get data up to scan time
-                        scan_data = data[data.index <= scan_time]
-                        if len(scan_data) < 50:
+                        # Last bar at or before scan time
+                        idx = data.index.searchsorted(scan_time, side='right') - 1
+                        if idx < 49:
                             continue
                         
-                        current_price = scan_data['Close'].iloc[-1]
+                        current_price = indicators['close'][idx]
                         
                         # Enhanced technical analysis
-                        technical_analysis = self.calculate_enhanced_technical_score(scan_data)
+                        technical_analysis = self.score_indicators(indicators['close'], indicators, idx)
                         
                         # Generate optimized signal
                         signal = self.generate_optimized_signal(pair, current_price, technical_analysis, scan_time)
@@ -665,30 +620,10 @@ class OptimizedAdvancedBacktest:
                                 position_info = self.calculate_optimized_position_size(signal, quality_analysis['quality_score'])
                                 
                                 # Get future data for simulation
-                                future_data = data[data.index > scan_time].head(80)  # More data for longer trades
+                                future_data = data.iloc[idx + 1:idx + 81]  # More data for longer trades
                                 
                                 if len(future_data) > 0:
-                                    # Simulate trade
-                                    trade_result = self.simulate_optimized_trade(signal, position_info, future_data)
-                                    
-                                    if trade_result['outcome'] not in ['NO_EXIT', 'ERROR']:
-                                        # Record trade
-                                        trade_record = {
-                                            'signal': signal,
-                                            'quality_analysis': quality_analysis,
-                                            'position_info': position_info,
-                                            'trade_result': trade_result
-                                        }
-                                        
-                                        self.executed_trades.append(trade_record)
-                                        self.filtered_signals.append(signal)
-                                        
-                                        # Update balance
-                                        self.current_balance += trade_result['profit_usd']
-                                        
-                                        outcome = 'WIN' if trade_result['profit_usd'] > 0 else 'LOSS'
-                                        logger.info(f"✅ {pair} {signal['signal_type']} → {outcome} ${trade_result['profit_usd']:.2f} "
-                                                  f"(Quality: {quality_analysis['quality_score']:.2f})")
+                                    self.execute_candidate_trade(signal, quality_analysis, position_info, future_data)
                                 
                             else:
                                 self.rejected_signals.append({
@@ -700,6 +635,8 @@ class OptimizedAdvancedBacktest:
                         logger.error(f"Error processing {pair} at {scan_time}: {e}")
                         continue
             
+            self.flush_candidate_trades()
+            
             # Calculate results
             results = self.calculate_results()
             logger.info("🎯 Optimized backtest completed successfully")
@@ -710,48 +647,80 @@ class OptimizedAdvancedBacktest:
             logger.error(f"Error running backtest: {e}")
             return {'error': str(e)}
     
+    def execute_candidate_trade(self, signal: Dict, quality_analysis: Dict, position_info: Dict,
+                                future_data: pd.DataFrame):
+        """Simulate a sized trade and record it straight away."""
+        trade_result = self.simulate_optimized_trade(signal, position_info, future_data)
+        self.record_trade(signal, quality_analysis, position_info, trade_result)
+    
+    def flush_candidate_trades(self):
+        """Hook for subclasses that defer execute_candidate_trade (nothing pending here)."""
+        pass
+    
+    def record_trade(self, signal: Dict, quality_analysis: Dict, position_info: Dict, trade_result: Dict):
+        """Record a simulated trade and update the balance."""
+        if trade_result['outcome'] in ['NO_EXIT', 'ERROR']:
+            return
+        
+        trade_record = {
+            'signal': signal,
+            'quality_analysis': quality_analysis,
+            'position_info': position_info,
+            'trade_result': trade_result
+        }
+        
+        self.executed_trades.append(trade_record)
+        self.filtered_signals.append(signal)
+        self._journal_trade(signal['pair'], trade_result)
+        
+        # Update balance
+        self.current_balance += trade_result['profit_usd']
+        
+        outcome = 'WIN' if trade_result['profit_usd'] > 0 else 'LOSS'
+        logger.info(f"✅ {signal['pair']} {signal['signal_type']} → {outcome} ${trade_result['profit_usd']:.2f} "
+                  f"(Quality: {quality_analysis['quality_score']:.2f})")
+    
     def calculate_results(self) -> Dict:
         """Calculate comprehensive backtest results."""
         try:
             if not self.executed_trades:
                 return {'total_trades': 0, 'error': 'No trades executed'}
             
-            total_trades = len(self.executed_trades)
-            winning_trades = [t for t in self.executed_trades if t['trade_result']['profit_usd'] > 0]
-            losing_trades = [t for t in self.executed_trades if t['trade_result']['profit_usd'] < 0]
+            journal = self._journal[:self._journal_size]
+            profit = journal['profit']
+            wins = profit > 0
+            losses = profit < 0
             
-            win_rate = len(winning_trades) / total_trades
-            total_profit = sum(t['trade_result']['profit_usd'] for t in self.executed_trades)
-            total_return = ((self.current_balance / self.initial_balance) - 1) * 100
+            total_trades = len(journal)
+            winning_count = int(wins.sum())
+            losing_count = int(losses.sum())
             
-            avg_win = np.mean([t['trade_result']['profit_usd'] for t in winning_trades]) if winning_trades else 0
-            avg_loss = np.mean([t['trade_result']['profit_usd'] for t in losing_trades]) if losing_trades else 0
+            win_rate = winning_count / total_trades
+            total_profit = float(profit.sum())
+            total_return = ((self.current_balance / self.initial_balance) - 1) * 100
             
-            profit_factor = abs(avg_win * len(winning_trades) / (avg_loss * len(losing_trades))) if losing_trades else float('inf')
+            avg_win = float(profit[wins].mean()) if winning_count else 0
+            avg_loss = float(profit[losses].mean()) if losing_count else 0
             
-            avg_hold_time = np.mean([t['trade_result']['hold_hours'] for t in self.executed_trades])
+            profit_factor = abs(avg_win * winning_count / (avg_loss * losing_count)) if losing_count else float('inf')
             
-            # Pair performance
-            pair_performance = {}
-            for trade in self.executed_trades:
-                pair = trade['signal']['pair']
-                if pair not in pair_performance:
-                    pair_performance[pair] = {'trades': 0, 'wins': 0, 'profit': 0, 'pips': 0}
-                
-                pair_performance[pair]['trades'] += 1
-                pair_performance[pair]['profit'] += trade['trade_result']['profit_usd']
-                pair_performance[pair]['pips'] += trade['trade_result']['profit_pips']
-                
-                if trade['trade_result']['profit_usd'] > 0:
-                    pair_performance[pair]['wins'] += 1
+            avg_hold_time = float(journal['hold_hours'].mean())
             
-            for pair in pair_performance:
-                pair_performance[pair]['win_rate'] = pair_performance[pair]['wins'] / pair_performance[pair]['trades']
+            # Pair performance - one groupby over the flat trade journal
+            trades_df = pd.DataFrame.from_records(journal)
+            pair_performance_df = trades_df.assign(win=wins).groupby('pair', sort=False).agg(
+                trades=('profit', 'size'),
+                wins=('win', 'sum'),
+                profit=('profit', 'sum'),
+                pips=('pips', 'sum')
+            )
+            pair_performance_df['win_rate'] = pair_performance_df['wins'] / pair_performance_df['trades']
+            pair_performance = pair_performance_df.to_dict(orient='index')
             
             return {
                 'total_trades': total_trades,
-                'winning_trades': len(winning_trades),
-                'losing_trades': len(losing_trades),
+                'winning_trades': winning_count,
+                'losing_trades': losing_count,
                 'win_rate': win_rate,
                 'total_profit': total_profit,
                 'avg_win': avg_win,
@@ -762,6 +731,7 @@ class OptimizedAdvancedBacktest:
                 'total_return': total_return,
                 'avg_hold_time': avg_hold_time,
                 'pair_performance': pair_performance,
+                'pair_performance_df': pair_performance_df,
                 'all_signals_count': len(self.all_signals),
                 'filtered_signals_count': len(self.filtered_signals),
                 'rejected_signals_count': len(self.rejected_signals),
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test that batch and per-signal linear position sizing agree
+"""
+
+import sys
+sys.path.append('src')
+
+import itertools
+import pandas as pd
+
+from linear_scaled_backtest import LinearScaledBacktest
+
+SIZING_COLUMNS = ('units', 'risk_amount', 'base_units')
+
+def sample_signals() -> pd.DataFrame:
+    """Every session / strength / quality band over a spread of stop distances."""
+    rows = itertools.product(
+        ("London-NY Overlap", "London Session", "NY Session", "Asian Session", "Off Hours"),
+        ('strong', 'moderate', 'weak'),
+        (0.45, 0.55, 0.65, 0.75),
+        (5.0, 15.0, 30.0, 60.0, 150.0)
+    )
+    return pd.DataFrame(rows, columns=['session_name', 'technical_strength', 'quality_score', 'pips_risk'])
+
+def test_batch_matches_scalar_sizing():
+    """calculate_optimized_position_size_batch must match the scalar kernel, including sub-$1,000 accounts."""
+    print("🧪 Testing Batch vs Scalar Position Sizing")
+    print("=" * 60)
+
+    signals = sample_signals()
+    for balance in (250, 500, 999, 1000, 10000, 50000):
+        backtest = LinearScaledBacktest(initial_balance=balance)
+        batch = backtest.calculate_optimized_position_size_batch(signals)
+
+        mismatches = 0
+        for (_, signal), (_, sized) in zip(signals.iterrows(), batch.iterrows()):
+            expected = backtest.calculate_optimized_position_size(signal.to_dict(), signal['quality_score'])
+            for column in SIZING_COLUMNS:
+                if abs(sized[column] - expected[column]) > 1e-9:
+                    mismatches += 1
+
+        print(f"   ${balance:,} account ({backtest.scale_factor:.3f}x): {mismatches} mismatches over {len(signals)} signals")
+        assert mismatches == 0
+        assert (batch['units'] >= 1000).all()
+
+if __name__ == "__main__":
+    test_batch_matches_scalar_sizing()
+    print("✅ Batch sizing matches the scalar path")
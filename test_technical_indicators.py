@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test that the TA-Lib and pandas indicator paths agree
+"""
+
+import sys
+sys.path.append('src')
+
+import numpy as np
+
+import _indicators
+from _indicators import technical_indicators
+
+def fixed_close_series(n: int = 500) -> np.ndarray:
+    """Deterministic EUR/USD-like hourly closes: drift, cycles and seeded noise."""
+    rng = np.random.default_rng(42)
+    t = np.arange(n)
+    return 1.08 + 0.002 * np.sin(t / 15) + 0.0005 * np.sin(t / 3) + np.cumsum(rng.normal(0, 0.0004, n))
+
+def indicators_with(talib_enabled: bool, close: np.ndarray) -> dict:
+    """technical_indicators with the TA-Lib path switched on or off."""
+    saved = _indicators.TALIB_AVAILABLE
+    _indicators.TALIB_AVAILABLE = talib_enabled
+    try:
+        return technical_indicators(close)
+    finally:
+        _indicators.TALIB_AVAILABLE = saved
+
+def test_talib_matches_pandas():
+    """Every indicator array (NaN warmup included) must match between the two paths."""
+    print("🧪 Testing TA-Lib vs pandas Indicators")
+    print("=" * 60)
+
+    if not _indicators.TALIB_AVAILABLE:
+        print("   ⚠️ TA-Lib not installed - only the pandas path is available, skipping")
+        return
+
+    close = fixed_close_series()
+    fast = indicators_with(True, close)
+    reference = indicators_with(False, close)
+
+    for name, expected in reference.items():
+        actual = fast[name]
+        assert np.array_equal(np.isnan(actual), np.isnan(expected)), f"{name}: warmup windows differ"
+        assert np.allclose(actual, expected, rtol=1e-9, atol=1e-9, equal_nan=True), f"{name}: values differ"
+        print(f"   {name}: max abs diff {np.nanmax(np.abs(actual - expected)):.2e}")
+
+    # Crossovers drive the technical score - they must land on the same bars
+    assert np.array_equal(np.sign(fast['macd_hist']), np.sign(reference['macd_hist']), equal_nan=True)
+
+if __name__ == "__main__":
+    test_talib_matches_pandas()
+    print("✅ Indicator paths agree")
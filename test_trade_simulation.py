@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the compiled trade simulation kernels on hand-built price paths
+"""
+
+import sys
+sys.path.append('src')
+
+import numpy as np
+
+from _trade_sim_jit import (
+    simulate_trade_path, simulate_trade_paths, MAX_HOLD_BARS,
+    OUTCOME_STOP_LOSS, OUTCOME_TARGET_HIT, OUTCOME_TIMEOUT, OUTCOME_NO_EXIT
+)
+
+PIP = 0.0001
+UNITS = 1000.0  # $0.10 per pip
+
+# (name, closes, entry, target, stop, is_buy, expected outcome, exit price, pips, usd, hold, partial)
+CASES = [
+    # Runs past 60% of the way (partial profit, stop to breakeven), then hits target
+    ("buy target", [1.1010, 1.1030, 1.1065], 1.1000, 1.1060, 1.0970, True,
+     OUTCOME_TARGET_HIT, 1.1060, 60.0, 6.0, 3, 0.3),
+    ("buy stop", [1.0990, 1.0965], 1.1000, 1.1060, 1.0970, True,
+     OUTCOME_STOP_LOSS, 1.0970, -30.0, -3.0, 2, 0.0),
+    ("sell target", [1.0990, 1.0935], 1.1000, 1.0940, 1.1030, False,
+     OUTCOME_TARGET_HIT, 1.0940, 60.0, 6.0, 2, 0.3),
+    ("sell stop", [1.1010, 1.1035], 1.1000, 1.0940, 1.1030, False,
+     OUTCOME_STOP_LOSS, 1.1030, -30.0, -3.0, 2, 0.0),
+    # Never reaches 25% progress, so neither stop nor target moves before the timeout
+    ("buy timeout", [1.1005] * (MAX_HOLD_BARS + 10), 1.1000, 1.1060, 1.0970, True,
+     OUTCOME_TIMEOUT, 1.1005, 5.0, 0.5, MAX_HOLD_BARS, 0.0),
+    ("sell no exit", [1.0995] * 10, 1.1000, 1.0940, 1.1030, False,
+     OUTCOME_NO_EXIT, 1.1000, 0.0, 0.0, 0, 0.0),
+]
+
+def run_case(case, dtype):
+    """simulate_trade_path on one case with bars of the given dtype."""
+    _, closes, entry, target, stop, is_buy = case[:6]
+    return simulate_trade_path(np.asarray(closes, dtype=dtype), entry, target, stop, is_buy, PIP, UNITS)
+
+def test_trade_path_outcomes():
+    """Each hand-built path exits the expected way, with the expected P&L."""
+    print("🧪 Testing Trade Path Outcomes")
+    print("=" * 60)
+
+    for dtype in (np.float64, np.float32):
+        for case in CASES:
+            name = case[0]
+            outcome, exit_price, pips, usd, hold, partial = run_case(case, dtype)
+            expected = case[6:]
+            print(f"   {name} ({np.dtype(dtype).name}): outcome={outcome} pips={pips:.1f} usd={usd:.2f} hold={hold}")
+
+            assert outcome == expected[0], name
+            # float32 bars round the timeout exit to ~1e-7
+            assert abs(exit_price - expected[1]) < 1e-6, name
+            assert abs(pips - expected[2]) < 1e-2, name
+            assert abs(usd - expected[3]) < 1e-3, name
+            assert hold == expected[4], name
+            assert abs(partial - expected[5]) < 1e-12, name
+
+def test_batch_matches_scalar():
+    """simulate_trade_paths over padded rows returns exactly the per-trade results."""
+    print("🧪 Testing Batch vs Scalar Trade Simulation")
+    print("=" * 60)
+
+    lengths = np.array([len(case[1]) for case in CASES], dtype=np.int64)
+    for dtype in (np.float64, np.float32):
+        closes = np.full((len(CASES), lengths.max()), np.nan, dtype=dtype)
+        for row, case in enumerate(CASES):
+            closes[row, :lengths[row]] = case[1]
+
+        batch = simulate_trade_paths(
+            closes, lengths,
+            np.array([case[2] for case in CASES]),
+            np.array([case[3] for case in CASES]),
+            np.array([case[4] for case in CASES]),
+            np.array([case[5] for case in CASES], dtype=np.bool_),
+            np.full(len(CASES), PIP),
+            np.full(len(CASES), UNITS)
+        )
+
+        for row, case in enumerate(CASES):
+            scalar = run_case(case, dtype)
+            assert tuple(column[row] for column in batch) == tuple(scalar), case[0]
+        print(f"   {np.dtype(dtype).name}: {len(CASES)} rows match")
+
+if __name__ == "__main__":
+    test_trade_path_outcomes()
+    test_batch_matches_scalar()
+    print("✅ Trade simulation kernels behave as expected")